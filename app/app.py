@@ -1,59 +1,187 @@
 """
 This code defines a simple web application using Flask.
 It creates a single route at the root URL ("/") that returns the message "Hello from Flask on Kubernetes (Minikube)!".
-When run directly, it starts a web server listening on all network interfaces at port 5000.
+In the container it is served by gunicorn on port 5000 (see gunicorn.conf.py).
 This is typically used as a minimal example for deploying Flask apps, such as in a Kubernetes environment.
 """
 
-import werkzeug
-from flask import Flask, jsonify
+import os
 
-# Compatibility shim: Werkzeug 3.x removed the `__version__` attribute that
-# older Flask test utilities reference. Provide a fallback so tests and
-# the Flask test client keep working when Werkzeug 3.x is installed.
-if not hasattr(werkzeug, "__version__"):
-    # set a reasonable default version string used only for compatibility checks
-    werkzeug.__version__ = "3.0.0"
+import cbor2
+from flask import Flask, Response, request
+from werkzeug.datastructures import Headers, MIMEAccept
+from werkzeug.exceptions import MethodNotAllowed, NotFound
+from werkzeug.http import parse_accept_header
+from werkzeug.middleware.dispatcher import DispatcherMiddleware
 
+# JSON encoder for the precomputed bodies: orjson when available, else ujson,
+# else the stdlib. Some targets (e.g. musl/ARMv6) have no orjson wheel. All
+# three produce identical compact UTF-8 bytes, and encoding happens once at
+# import, so the choice never affects request handling.
+try:
+    from orjson import dumps as _dumps
+except ImportError:
+    try:
+        import ujson
 
-app = Flask(__name__)
+        def _dumps(obj):
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode()
+    except ImportError:
+        import json
+
+        def _dumps(obj):
+            return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
 
-@app.route("/")
-def hello():
-    return jsonify(message="Hello from Flask on Kubernetes (Minikube)!")
 
-@app.route("/health")
-def health():
+class _StaticRoutesFlask(Flask):
     """
-    Health check endpoint for Kubernetes liveness probe.
-    Returns a simple status indicating the application is alive.
-    
-    Note: Cache-Control headers prevent caching to ensure real-time health status.
+    Flask app that answers constant-payload routes before entering the router.
+
+    Werkzeug's URL map matching, the request context and the view call are
+    all skipped for requests found in `_STATIC_ROUTES`. Everything else,
+    including other methods on those paths (405) and clients asking for
+    CBOR, falls through to normal Flask dispatch.
     """
-    response = jsonify(status="healthy")
-    response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-    response.headers['Pragma'] = 'no-cache'
-    response.headers['Expires'] = '0'
-    return response, 200
-
-@app.route("/ready")
-def ready():
+
+    def wsgi_app(self, environ, start_response):
+        entry = _STATIC_ROUTES.get((environ["REQUEST_METHOD"], environ.get("PATH_INFO")))
+        if entry is not None and "cbor" not in environ.get("HTTP_ACCEPT", ""):
+            body, headers, status = entry
+            start_response(status, headers)
+            return [body]
+        return super().wsgi_app(environ, start_response)
+
+
+app = _StaticRoutesFlask(__name__)
+
+_JSON = "application/json"
+_CBOR = "application/cbor"
+
+# Every route returns a constant payload, so serialize once at import time.
+# Requests then only pay for building the Response around these bytes.
+# Clients that send `Accept: application/cbor` get the smaller CBOR encoding;
+# everyone else (including Kubernetes probes) gets JSON.
+_HELLO = {"message": "Hello from Flask on Kubernetes (Minikube)!"}
+_HEALTH = {"status": "healthy"}
+_READY = {"status": "ready"}
+
+_HELLO_BYTES = {_JSON: _dumps(_HELLO), _CBOR: cbor2.dumps(_HELLO)}
+_HEALTH_BYTES = {_JSON: _dumps(_HEALTH), _CBOR: cbor2.dumps(_HEALTH)}
+_READY_BYTES = {_JSON: _dumps(_READY), _CBOR: cbor2.dumps(_READY)}
+
+# Response headers are constant too, so build one Headers object per route and
+# mimetype up front. Views hand Response a copy (a single list clone) because
+# Response adopts a Headers instance as-is and later mutation (Content-Length,
+# after_request hooks) must not leak into the template.
+def _headers(mimetype, *extra):
+    return Headers([("Content-Type", mimetype), ("Vary", "Accept"), *extra])
+
+
+# `/` also names the pod serving the request (downward API, see
+# k8s/deployment.yaml), so clients can tell replicas apart without reading
+# their logs.
+_POD_NAME_HEADER = ("X-Pod-Name", os.environ.get("POD_NAME", "unknown"))
+_HELLO_HEADERS = {mt: _headers(mt, _POD_NAME_HEADER) for mt in (_JSON, _CBOR)}
+
+# Probe responses must never be cached (see the probe mounts below)
+_PROBE_HEADERS = {
+    mt: _headers(
+        mt,
+        ("Cache-Control", "no-cache, no-store, must-revalidate"),
+        ("Pragma", "no-cache"),
+        ("Expires", "0"),
+    )
+    for mt in (_JSON, _CBOR)
+}
+
+
+def _negotiate():
+    """Return the response mimetype for this request: CBOR if preferred, else JSON."""
+    return _CBOR if request.accept_mimetypes.best_match([_JSON, _CBOR]) == _CBOR else _JSON
+
+
+@app.route("/")
+def hello():
+    mimetype = _negotiate()
+    return Response(_HELLO_BYTES[mimetype], status=200, headers=_HELLO_HEADERS[mimetype].copy())
+
+
+def _static_response(body, headers, status="200 OK"):
+    """Precompute the (body, WSGI header list, status) triple for a response."""
+    return body, [*headers.to_wsgi_list(), ("Content-Length", str(len(body)))], status
+
+
+def _negotiate_environ(environ):
+    """Same as _negotiate(), for WSGI code running outside a Flask request."""
+    accept = environ.get("HTTP_ACCEPT", "")
+    if "cbor" not in accept:
+        return _JSON
+    best = parse_accept_header(accept, MIMEAccept).best_match([_JSON, _CBOR])
+    return _CBOR if best == _CBOR else _JSON
+
+
+def _flask_response(response):
+    """Precompute the (body, WSGI header list, status) triple of a werkzeug Response."""
+    return response.get_data(), response.headers.to_wsgi_list(), response.status
+
+
+# Everything other than a probe hit gets the response Flask would have sent
+# for a GET-only route at that path: its HTML 404 for any subpath (including a
+# trailing slash, since Flask only redirects the other way), its automatic
+# OPTIONS answer, and its HTML 405 listing the allowed methods.
+_PROBE_METHODS = ["GET", "HEAD", "OPTIONS"]
+_PROBE_NOT_FOUND = _flask_response(NotFound().get_response())
+_PROBE_METHOD_NOT_ALLOWED = _flask_response(MethodNotAllowed(_PROBE_METHODS).get_response())
+_PROBE_OPTIONS = _flask_response(Response(b"", headers={"Allow": ", ".join(_PROBE_METHODS)}))
+
+
+def _probe_app(bodies):
     """
-    Readiness check endpoint for Kubernetes readiness probe.
-    Indicates whether the application is ready to receive traffic.
-    
-    For this simple application:
-    - Always returns 200 (no dependencies to check)
-    - Could be enhanced to check database, cache, or external service connections
-    
-    Note: Different from /health (liveness) - readiness controls traffic routing,
-    liveness controls pod restarts.
+    Build the pure-WSGI app serving a single probe at its mount point.
+
+    Probes bypass Flask entirely: for a constant body, the request context,
+    signals, teardown and before/after_request hooks are pure overhead, and
+    Kubernetes calls these endpoints every few seconds on every pod. Every
+    response, including 404/405 and OPTIONS, is precomputed, so a probe costs
+    a couple of dict lookups and a start_response call.
     """
-    response = jsonify(status="ready")
-    response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-    response.headers['Pragma'] = 'no-cache'
-    response.headers['Expires'] = '0'
-    return response, 200
-
-if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000)
+    responses = {mt: _static_response(bodies[mt], _PROBE_HEADERS[mt]) for mt in (_JSON, _CBOR)}
+
+    def probe(environ, start_response):
+        method = environ["REQUEST_METHOD"]
+        if environ.get("PATH_INFO", ""):
+            body, headers, status = _PROBE_NOT_FOUND
+        elif method == "OPTIONS":
+            body, headers, status = _PROBE_OPTIONS
+        elif method not in ("GET", "HEAD"):
+            body, headers, status = _PROBE_METHOD_NOT_ALLOWED
+        else:
+            body, headers, status = responses[_negotiate_environ(environ)]
+        start_response(status, headers)
+        # HEAD keeps GET's headers (including Content-Length) but sends no body
+        return [] if method == "HEAD" else [body]
+
+    return probe
+
+
+# (body, headers, status) served directly by _StaticRoutesFlask.wsgi_app.
+# The probes are not listed: their mounts below already sit in front of Flask.
+_STATIC_ROUTES = {
+    ("GET", "/"): _static_response(_HELLO_BYTES[_JSON], _HELLO_HEADERS[_JSON]),
+}
+
+# Liveness probe (/health): is the process alive? Failing restarts the pod.
+#
+# Readiness probe (/ready): should the pod receive traffic? Failing removes it
+# from the Service endpoints. This app has no dependencies to check, so it is
+# always ready; a database or cache check would go here.
+#
+# Cache-Control headers on both probes ensure Kubernetes always sees
+# real-time status rather than a cached response.
+app.wsgi_app = DispatcherMiddleware(app.wsgi_app, {
+    "/health": _probe_app(_HEALTH_BYTES),
+    "/ready": _probe_app(_READY_BYTES),
+})
+
+# No `app.run()` entrypoint: the app is served by gunicorn in the container.
+#   gunicorn -c gunicorn.conf.py app:app
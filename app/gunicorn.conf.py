@@ -0,0 +1,35 @@
+"""
+Gunicorn configuration for the hello-flask container.
+
+Replaces the Werkzeug development server (`app.run()`), which handles one
+request at a time and is not meant for production traffic.
+
+Usage:
+    gunicorn -c gunicorn.conf.py app:app
+
+Worker count is 2 x CPU. Inside Kubernetes `os.cpu_count()` reports the
+node's CPUs rather than the container's limit, so the deployment pins
+WEB_CONCURRENCY explicitly.
+"""
+
+import os
+
+bind = "0.0.0.0:5000"
+
+workers = int(os.environ.get("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2))
+
+# The sync worker closes the connection after every response, so each request
+# through the ingress pays a new TCP handshake. gthread workers keep
+# connections open; the views are tiny CPU-bound responses, so a couple of
+# threads per worker is enough. GUNICORN_WORKER_CLASS allows swapping in
+# another keep-alive worker (e.g. meinheld) where it can be installed.
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.environ.get("GUNICORN_THREADS", 2))
+
+# Longer than nginx-ingress's upstream keepalive timeout (60s), so the proxy
+# always closes idle connections first and never reuses one gunicorn dropped.
+keepalive = 75
+
+# Log requests to stdout like the dev server did, so `kubectl logs` shows the
+# traffic each pod served when debugging.
+accesslog = "-"
@@ -27,23 +27,63 @@ Usage:
         $ make unit-tests
 """
 
+import json
 import time
+import cbor2
 import pytest
+from flask import request, request_started
+from werkzeug.datastructures import Headers
+from werkzeug.test import EnvironBuilder
 from app import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client for the Flask application."""
+    """
+    Create a test client for the Flask application.
+    
+    Shared across the module: the endpoints are stateless and no test relies
+    on cookies or sessions, so one client serves every test.
+    """
     return app.test_client()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def home_response(client):
     """Get the response from the home route."""
     return client.get('/')
 
 
+@pytest.fixture(scope="module")
+def ready_environ():
+    """WSGI environ for GET /ready, built once and reused across calls."""
+    return EnvironBuilder(path='/ready', method='GET').get_environ()
+
+
+def call_wsgi(environ):
+    """
+    Run one request through app.wsgi_app directly and return (status, headers, body).
+    
+    Skips the test client's per-call environ building and response wrapping,
+    which dominates tight probe-call loops. The environ is copied because
+    routing middleware rewrites PATH_INFO/SCRIPT_NAME in place.
+    """
+    captured = []
+    
+    def start_response(status, headers, exc_info=None):
+        captured.append((status, Headers(headers)))
+    
+    app_iter = app.wsgi_app(dict(environ), start_response)
+    try:
+        body = b''.join(app_iter)
+    finally:
+        if hasattr(app_iter, 'close'):
+            app_iter.close()
+    
+    status, headers = captured[0]
+    return status, headers, body
+
+
 def test_home_returns_200_ok(home_response):
     """Test that HTTP GET to / returns 200 OK status."""
     assert home_response.status_code == 200
@@ -67,19 +107,16 @@ def test_response_latency(client):
     assert latency < 1.0, f"Response took {latency:.3f}s, expected < 1.0s"
 
 
-def test_invalid_route_returns_404(client):
+@pytest.mark.parametrize('route', [
+    '/invalid',
+    '/nonexistent',
+    '/api/unknown',
+    '/random/path',
+])
+def test_invalid_route_returns_404(client, route):
     """Test that invalid routes return 404 Not Found."""
-    # Test various invalid routes
-    invalid_routes = [
-        '/invalid',
-        '/nonexistent',
-        '/api/unknown',
-        '/random/path'
-    ]
-    
-    for route in invalid_routes:
-        response = client.get(route)
-        assert response.status_code == 404, f"Route {route} should return 404, got {response.status_code}"
+    response = client.get(route)
+    assert response.status_code == 404, f"Route {route} should return 404, got {response.status_code}"
 
 
 def test_health_endpoint_returns_200(client):
@@ -187,7 +224,13 @@ def test_ready_vs_health_independence(client):
         assert latency < 0.1, f"{endpoint} too slow: {latency:.3f}s"
 
 
-def test_ready_endpoint_http_methods(client):
+@pytest.mark.parametrize('method, expected_status', [
+    ('GET', 200),     # This is what the K8s probe uses
+    ('POST', 405),    # Readiness check is read-only
+    ('PUT', 405),
+    ('DELETE', 405),
+])
+def test_ready_endpoint_http_methods(client, method, expected_status):
     """
     Test that /ready only accepts GET requests.
     
@@ -200,24 +243,12 @@ def test_ready_endpoint_http_methods(client):
     - POST/PUT/DELETE could imply state changes (inappropriate for health checks)
     - Proper HTTP semantics improve API clarity and security
     """
-    # GET should work (this is what K8s probe uses)
-    response = client.get('/ready')
-    assert response.status_code == 200
-    
-    # POST should fail (readiness check is read-only)
-    response = client.post('/ready')
-    assert response.status_code == 405, "POST to /ready should return 405 Method Not Allowed"
-    
-    # PUT should fail
-    response = client.put('/ready')
-    assert response.status_code == 405, "PUT to /ready should return 405 Method Not Allowed"
-    
-    # DELETE should fail
-    response = client.delete('/ready')
-    assert response.status_code == 405, "DELETE to /ready should return 405 Method Not Allowed"
+    response = client.open('/ready', method=method)
+    assert response.status_code == expected_status, \
+        f"{method} to /ready should return {expected_status}, got {response.status_code}"
 
 
-def test_ready_endpoint_consistency(client):
+def test_ready_endpoint_consistency(ready_environ):
     """
     Test that /ready returns consistent results across multiple calls.
     
@@ -237,22 +268,22 @@ def test_ready_endpoint_consistency(client):
     
     The endpoint MUST be idempotent and stateless.
     """
-    responses = [client.get('/ready') for _ in range(10)]
+    responses = [call_wsgi(ready_environ) for _ in range(10)]
     
     # All should return 200
-    for i, response in enumerate(responses, 1):
-        assert response.status_code == 200, f"Call {i} failed"
-        assert response.get_json() == {"status": "ready"}, \
+    for i, (status, _, body) in enumerate(responses, 1):
+        assert status == '200 OK', f"Call {i} failed"
+        assert json.loads(body) == {"status": "ready"}, \
             f"Call {i} returned different content"
     
     # All should have same cache headers (no randomness/variation)
-    first_cache_control = responses[0].headers.get('Cache-Control')
-    for i, response in enumerate(responses[1:], 2):
-        assert response.headers.get('Cache-Control') == first_cache_control, \
+    first_cache_control = responses[0][1].get('Cache-Control')
+    for i, (_, headers, _) in enumerate(responses[1:], 2):
+        assert headers.get('Cache-Control') == first_cache_control, \
             f"Call {i} has different Cache-Control headers"
 
 
-def test_ready_endpoint_no_side_effects(client):
+def test_ready_endpoint_no_side_effects(client, ready_environ):
     """
     Test that calling /ready has no side effects.
     
@@ -277,8 +308,8 @@ def test_ready_endpoint_no_side_effects(client):
     """
     # Simulate frequent probe calls (20 rapid calls)
     for _ in range(20):
-        response = client.get('/ready')
-        assert response.status_code == 200
+        status, _, _ = call_wsgi(ready_environ)
+        assert status == '200 OK'
     
     # Main app should still work normally (no state corruption)
     root_response = client.get('/')
@@ -350,7 +381,13 @@ def test_ready_endpoint_cache_control_detailed(client):
     assert response.get_json() == {"status": "ready"}
 
 
-def test_health_endpoint_http_methods(client):
+@pytest.mark.parametrize('method, expected_status', [
+    ('GET', 200),
+    ('POST', 405),
+    ('PUT', 405),
+    ('DELETE', 405),
+])
+def test_health_endpoint_http_methods(client, method, expected_status):
     """
     Test that /health only accepts GET requests.
     
@@ -358,21 +395,9 @@ def test_health_endpoint_http_methods(client):
     Kubernetes probes only send GET requests. Other HTTP methods
     should return 405 Method Not Allowed to follow REST principles.
     """
-    # GET should work
-    response = client.get('/health')
-    assert response.status_code == 200
-    
-    # POST should fail (not supported)
-    response = client.post('/health')
-    assert response.status_code == 405, "POST to /health should return 405 Method Not Allowed"
-    
-    # PUT should fail
-    response = client.put('/health')
-    assert response.status_code == 405, "PUT to /health should return 405 Method Not Allowed"
-    
-    # DELETE should fail
-    response = client.delete('/health')
-    assert response.status_code == 405, "DELETE to /health should return 405 Method Not Allowed"
+    response = client.open('/health', method=method)
+    assert response.status_code == expected_status, \
+        f"{method} to /health should return {expected_status}, got {response.status_code}"
 
 
 def test_health_endpoint_consistency(client):
@@ -509,3 +534,121 @@ def test_health_endpoint_cache_control(client):
     assert response.status_code == 200
     assert response.get_json() == {"status": "healthy"}
 
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("/", {"message": "Hello from Flask on Kubernetes (Minikube)!"}),
+    ("/health", {"status": "healthy"}),
+    ("/ready", {"status": "ready"}),
+])
+def test_cbor_response_when_requested(client, path, expected):
+    """
+    Test that clients sending Accept: application/cbor get a CBOR body.
+    
+    Educational Note:
+    CBOR carries the same data as JSON in fewer bytes. It is opt-in:
+    Kubernetes probes send no such Accept header and keep getting JSON.
+    """
+    response = client.get(path, headers={"Accept": "application/cbor"})
+    
+    assert response.status_code == 200
+    assert response.content_type == "application/cbor"
+    assert cbor2.loads(response.data) == expected
+    assert response.headers.get('Vary') == 'Accept', "Negotiated responses must set Vary: Accept"
+
+
+def test_json_is_default_without_cbor_accept(client):
+    """Test that JSON stays the default for browsers and generic clients."""
+    for accept in ['*/*', 'text/html', 'application/json']:
+        response = client.get('/health', headers={"Accept": accept})
+        assert response.content_type == "application/json", f"Accept: {accept} should get JSON"
+        assert response.get_json() == {"status": "healthy"}
+
+
+def test_probes_bypass_flask_request_handling(client):
+    """
+    Test that probe requests never enter Flask's request handling.
+    
+    Educational Note:
+    /health and /ready are mounted in front of Flask, so hooks added to the
+    main app later (auth, request logging, metrics timers) do not run for
+    the ~34,560 probe calls per day this deployment receives.
+    """
+    handled_by_flask = []
+    
+    def record(sender, **extra):
+        handled_by_flask.append(request.path)
+    
+    with request_started.connected_to(record, app):
+        assert client.get('/health').status_code == 200
+        assert client.get('/ready').status_code == 200
+        assert client.get('/invalid').status_code == 404
+    
+    assert handled_by_flask == ['/invalid'], \
+        f"Probe requests reached Flask: {handled_by_flask}"
+
+
+@pytest.mark.parametrize('path', ['/health', '/ready'])
+def test_probe_head_matches_get_headers(client, path):
+    """
+    Test that HEAD and GET on a probe return the same headers.
+    
+    Educational Note:
+    Probes are served from precomputed responses that HEAD shares with
+    GET: HEAD must keep GET's headers, including a Content-Length that
+    matches the GET body, and send no body of its own.
+    """
+    get_response = client.get(path)
+    head_response = client.head(path)
+    
+    assert head_response.status_code == 200
+    assert head_response.data == b''
+    assert int(get_response.headers['Content-Length']) == len(get_response.data)
+    for name in ('Content-Type', 'Content-Length', 'Cache-Control', 'Pragma', 'Expires', 'Vary'):
+        assert head_response.headers.get(name) == get_response.headers.get(name), \
+            f"{name} differs between HEAD and GET on {path}"
+
+
+@pytest.mark.parametrize('path', ['/health', '/ready'])
+def test_probe_errors_match_flask_routes(client, path):
+    """
+    Test that probes answer everything else exactly as a Flask route would.
+    
+    Educational Note:
+    Probes are mounted in front of Flask, but clients must not be able to
+    tell: a trailing slash or subpath is Flask's HTML 404 (the same body as
+    any unknown URL), OPTIONS lists the allowed methods with a 200, and
+    other methods get Flask's 405 with an Allow header.
+    """
+    unknown = client.get('/invalid')
+    for subpath in (path + '/', path + '/extra'):
+        response = client.get(subpath)
+        assert response.status_code == 404, f"{subpath} should return 404"
+        assert response.content_type == unknown.content_type
+        assert response.data == unknown.data
+    
+    options = client.options(path)
+    assert options.status_code == 200
+    assert options.data == b''
+    assert set(options.headers['Allow'].split(', ')) == {'GET', 'HEAD', 'OPTIONS'}
+    
+    not_allowed = client.post(path)
+    assert not_allowed.status_code == 405
+    assert not_allowed.content_type == 'text/html; charset=utf-8'
+    assert set(not_allowed.headers['Allow'].split(', ')) == {'GET', 'HEAD', 'OPTIONS'}
+
+
+@pytest.mark.parametrize('accept', ['application/json', 'application/cbor'])
+def test_home_reports_pod_name(client, accept):
+    """
+    Test that / names the serving pod in the X-Pod-Name header.
+    
+    Educational Note:
+    The Deployment injects POD_NAME through the downward API. Outside
+    Kubernetes it is unset and the header reads "unknown". Both the
+    precomputed JSON response and the Flask-rendered CBOR one carry it.
+    """
+    response = client.get('/', headers={"Accept": accept})
+    
+    assert response.status_code == 200
+    assert response.headers.get('X-Pod-Name') == 'unknown'
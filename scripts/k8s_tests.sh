@@ -10,7 +10,16 @@ enable_debug_mode
 # Main execution
 print_header "Kubernetes Integration Tests"
 echo ""
-run_pytest "test_k8s/" "-v -m 'not manual and not nodeport and not educational'" "Testing deployment, services, configmaps, ingress, liveness & readiness probes"
+
+# Spread the tests across workers when pytest-xdist is available. Tests marked
+# serial (pod restarts, latency) are all nodeport or manual, so none are
+# selected here; they run in the single-process health-tests/manual targets.
+xdist_args=""
+if python -c "import xdist" 2>/dev/null; then
+    xdist_args="-n auto"
+fi
+
+run_pytest "test_k8s/" "-v $xdist_args -m 'not manual and not nodeport and not educational'" "Testing deployment, services, configmaps, ingress, liveness & readiness probes"
 log_success "Kubernetes tests completed!"
 log_note "Note: Manual, NodePort, and Educational tests excluded."
 log_note "To run manual tests: pytest test_k8s/ -v -m manual"
@@ -4,18 +4,27 @@ Pytest configuration and fixtures for Kubernetes tests.
 This module provides shared fixtures and configuration for all tests
 in the test_k8s directory.
 """
+import base64
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-import time
+import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, List
 
 from .utils import (
-    get_pods,
-    get_running_pods,
-    get_deployment,
-    get_service,
-    get_ingress,
+    ClusterSnapshot,
+    PodCache,
+    get_ingress_url_and_host,
+    get_minikube_ip,
+    get_pod_env,
     is_ci_environment,
     print_debug_info,
+    wait_for_ingress_address,
+    wait_for_service_url,
+    wait_for_pods_stable,
     KubectlError
 )
 
@@ -58,6 +67,76 @@ def ci_environment() -> bool:
     return is_ci_environment()
 
 
+@pytest.fixture(scope="session")
+def minikube_ip() -> str:
+    """
+    Fixture that provides the Minikube cluster IP, looked up once per session.
+    
+    Returns:
+        Minikube IP address
+        
+    Raises:
+        pytest.skip: If the Minikube IP cannot be determined
+        
+    Example:
+        def test_ingress(minikube_ip):
+            url = f"http://{minikube_ip}"
+    """
+    ip = get_minikube_ip()
+    if not ip:
+        pytest.skip("Cannot get Minikube IP")
+    return ip
+
+
+@pytest.fixture(scope="session")
+def service_url(service_name) -> str:
+    """
+    Fixture that provides the app's NodePort service URL, looked up once per session.
+    
+    Returns:
+        Service URL (e.g. "http://192.168.49.2:30080")
+        
+    Raises:
+        pytest.fail: If the service URL cannot be determined
+        
+    Example:
+        @pytest.mark.nodeport
+        def test_health(http, service_url):
+            resp = http.get(f"{service_url}/health", timeout=5)
+    """
+    url = wait_for_service_url(service_name)
+    if not url:
+        pytest.fail(f"Cannot get URL for service '{service_name}' (is it a NodePort service?)")
+    return url
+
+
+@pytest.fixture(scope="session")
+def http() -> requests.Session:
+    """
+    Fixture that provides a shared HTTP session with keep-alive.
+    
+    Requests to the same host reuse pooled connections instead of opening
+    a new TCP connection each time. The Host header stays per request,
+    because the same session reaches Ingress, NodePort and port-forward URLs.
+    
+    Note: kube-proxy balances NodePort traffic per connection, so tests
+    that need to spread requests across pods should not reuse connections.
+    
+    Returns:
+        requests.Session
+        
+    Example:
+        def test_root(http, minikube_ip):
+            resp = http.get(f"http://{minikube_ip}", headers={"Host": "hello-flask.local"}, timeout=5)
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    yield session
+    session.close()
+
+
 @pytest.fixture(scope="session")
 def deployment_name() -> str:
     """
@@ -125,11 +204,132 @@ def label_selector() -> str:
     return "app=hello-flask"
 
 
+@pytest.fixture(scope="session")
+def cluster_snapshot(deployment_name, service_name, ingress_name,
+                     configmap_name, secret_name) -> ClusterSnapshot:
+    """
+    Fixture that fetches the app's Deployment, Service, Ingress, ConfigMap
+    and Secret together, once for the whole session.
+    
+    Returns:
+        ClusterSnapshot; call refresh() on it after changing a resource
+        
+    Example:
+        def test_replicas(cluster_snapshot, deployment_name):
+            dep = cluster_snapshot.get("Deployment", deployment_name)
+    """
+    return ClusterSnapshot([
+        f"deployment/{deployment_name}",
+        f"service/{service_name}",
+        f"ingress/{ingress_name}",
+        f"configmap/{configmap_name}",
+        f"secret/{secret_name}",
+    ])
+
+
+@pytest.fixture(scope="session")
+def pod_cache(label_selector):
+    """
+    Fixture that provides a watch-backed local cache of the app's pods.
+    
+    A background watch keeps the cache current, so pod lookups are
+    answered from memory yet still reflect pods deleted or restarted
+    during the session. While it runs, get_pods(), get_pod_by_name() and
+    get_pod_restart_count() are served from it as well.
+    
+    Returns:
+        PodCache (falls back to live kubectl lookups if it cannot sync)
+        
+    Example:
+        def test_pods_exist(pod_cache):
+            assert len(pod_cache.pods()) > 0
+    """
+    # No wait_for_sync here: the first LIST runs in the background and
+    # pods() waits for it only if it is still in flight
+    cache = PodCache(label_selector).start()
+    yield cache
+    cache.stop()
+
+
+@pytest.fixture(scope="session")
+def ingress_url_and_host(ingress):
+    """
+    Fixture that provides the URL and Host header for reaching the app via Ingress.
+    
+    Resolved once per session (Minikube IP in CI, the Ingress hostname
+    locally), so every Ingress test sends the same request target.
+    
+    Returns:
+        (url, host_header) tuple; both None if the Ingress has no rules
+        
+    Example:
+        def test_root(http, ingress_url_and_host):
+            url, host = ingress_url_and_host
+            resp = http.get(url, headers={"Host": host}, timeout=5)
+    """
+    return get_ingress_url_and_host(ingress)
+
+
+@pytest.fixture(scope="session")
+def ingress_address(ingress, ingress_name, k8s_timeouts):
+    """
+    Fixture that waits for the Ingress address in a background thread.
+    
+    The controller can take up to k8s_timeouts['ingress_ready'] seconds to
+    assign an address; started early, that wait overlaps with the rest of
+    the session instead of blocking the one test that needs it.
+    
+    Returns:
+        Future resolving to the address, or None if none was assigned in time
+        
+    Raises:
+        pytest.skip: If the Ingress is not deployed (via the ingress fixture)
+        
+    Example:
+        def test_address(ingress_address):
+            assert ingress_address.result()
+    """
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(
+        wait_for_ingress_address, ingress_name,
+        timeout=k8s_timeouts.get('ingress_ready', 60), stop=stop
+    )
+    yield future
+    stop.set()
+    executor.shutdown(wait=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def prefetch_cluster_state(request, pod_cache, ingress_name):
+    """
+    Fixture that loads the shared cluster state at the start of the session.
+    
+    The pod cache starts its LIST/WATCH in a background thread, and the
+    resource snapshot is fetched while that LIST is in flight. When ingress
+    tests are selected, `minikube ip` (cached for the session) is looked up
+    on a worker thread at the same time. The round-trips overlap instead
+    of running one after the other on whichever tests first need them.
+    If the Ingress exists, the wait for its address starts here too.
+    """
+    ingress_selected = any(item.get_closest_marker("ingress") for item in request.session.items)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        if ingress_selected:
+            executor.submit(get_minikube_ip)
+        cluster_snapshot = request.getfixturevalue("cluster_snapshot")
+    
+    if ingress_selected and cluster_snapshot.get("Ingress", ingress_name):
+        request.getfixturevalue("ingress_address")
+
+
 @pytest.fixture(scope="function")
-def pods(label_selector) -> List[Dict[str, Any]]:
+def pods(pod_cache) -> List[Dict[str, Any]]:
     """
     Fixture that provides current list of pods.
     
+    Read from the watch-backed pod_cache, so the list is up to date even
+    in tests that change cluster state (deleting pods, crashing containers).
+    
     Returns:
         List of pod dictionaries
         
@@ -137,11 +337,11 @@ def pods(label_selector) -> List[Dict[str, Any]]:
         def test_pods_exist(pods):
             assert len(pods) > 0, "No pods found"
     """
-    return get_pods(label_selector)
+    return pod_cache.pods()
 
 
 @pytest.fixture(scope="function")
-def running_pods(label_selector) -> List[Dict[str, Any]]:
+def running_pods(pod_cache) -> List[Dict[str, Any]]:
     """
     Fixture that provides list of running and ready pods.
     
@@ -153,11 +353,68 @@ def running_pods(label_selector) -> List[Dict[str, Any]]:
             desired = deployment['spec']['replicas']
             assert len(running_pods) == desired
     """
-    return get_running_pods(label_selector)
+    return pod_cache.running_pods()
 
 
 @pytest.fixture(scope="function")
-def deployment(deployment_name) -> Dict[str, Any]:
+def multi_pod_required(running_pods) -> List[Dict[str, Any]]:
+    """
+    Fixture that provides the running pods, skipping unless there are at least two.
+    
+    Tests that need traffic spread across replicas (e.g. load balancing)
+    skip at setup, before any request is made, on single-replica clusters.
+    
+    Returns:
+        List of running pod dictionaries (two or more)
+        
+    Raises:
+        pytest.skip: If fewer than two pods are running
+        
+    Example:
+        def test_spread(multi_pod_required):
+            names = [pod['metadata']['name'] for pod in multi_pod_required]
+    """
+    if len(running_pods) < 2:
+        pytest.skip(f"Need at least 2 running pods, found {len(running_pods)}")
+    return running_pods
+
+
+@pytest.fixture(scope="session")
+def session_running_pods(pod_cache) -> List[Dict[str, Any]]:
+    """
+    Fixture that provides the running and ready pods, taken once per session.
+    
+    Returns:
+        List of running pod dictionaries
+    """
+    return pod_cache.running_pods()
+
+
+@pytest.fixture(scope="session")
+def pod_env(session_running_pods) -> Dict[str, str]:
+    """
+    Fixture that provides the environment of the first running pod.
+    
+    Read with a single `env` exec per session; the ConfigMap and Secret
+    tests all check their values against this one dictionary.
+    
+    Returns:
+        Dictionary of environment variable names to values
+        
+    Raises:
+        pytest.fail: If no running pod is available
+        
+    Example:
+        def test_app_env(pod_env):
+            assert pod_env.get("APP_ENV") == "local"
+    """
+    if not session_running_pods:
+        pytest.fail("No running pods found to read the environment from")
+    return get_pod_env(session_running_pods[0]["metadata"]["name"])
+
+
+@pytest.fixture(scope="session")
+def deployment(cluster_snapshot, deployment_name) -> Dict[str, Any]:
     """
     Fixture that provides the deployment object.
     
@@ -172,14 +429,35 @@ def deployment(deployment_name) -> Dict[str, Any]:
             replicas = deployment['spec']['replicas']
             assert replicas >= 2
     """
-    dep = get_deployment(deployment_name)
+    dep = cluster_snapshot.get("Deployment", deployment_name)
     if not dep:
         pytest.skip(f"Deployment '{deployment_name}' not found")
     return dep
 
 
-@pytest.fixture(scope="function")
-def configmap(configmap_name):
+@pytest.fixture(scope="session")
+def main_container(deployment) -> Dict[str, Any]:
+    """
+    Fixture that provides the deployment's first (application) container.
+    
+    Returns:
+        Container spec dictionary
+        
+    Raises:
+        pytest.fail: If the deployment has no containers
+        
+    Example:
+        def test_probe(main_container):
+            assert "livenessProbe" in main_container
+    """
+    containers = deployment["spec"]["template"]["spec"]["containers"]
+    if not containers:
+        pytest.fail("No containers found in deployment")
+    return containers[0]
+
+
+@pytest.fixture(scope="session")
+def configmap(cluster_snapshot, configmap_name):
     """
     Fixture that provides the ConfigMap object.
     
@@ -194,15 +472,14 @@ def configmap(configmap_name):
             data = configmap.get('data', {})
             assert 'APP_ENV' in data
     """
-    from .utils import get_configmap
-    cm = get_configmap(configmap_name)
+    cm = cluster_snapshot.get("ConfigMap", configmap_name)
     if not cm:
         pytest.skip(f"ConfigMap '{configmap_name}' not found")
     return cm
 
 
-@pytest.fixture(scope="function")
-def secret(secret_name):
+@pytest.fixture(scope="session")
+def secret(cluster_snapshot, secret_name):
     """
     Fixture that provides the Secret object.
     
@@ -217,14 +494,38 @@ def secret(secret_name):
             data = secret.get('data', {})
             assert 'API_KEY' in data
     """
-    from .utils import get_secret
-    sec = get_secret(secret_name)
+    sec = cluster_snapshot.get("Secret", secret_name)
     if not sec:
         pytest.skip(f"Secret '{secret_name}' not found")
     return sec
 
-@pytest.fixture(scope="function")
-def service(service_name) -> Dict[str, Any]:
+
+@pytest.fixture(scope="session")
+def decoded_secret(secret) -> Dict[str, str]:
+    """
+    Fixture that provides the Secret's data, base64-decoded once per session.
+    
+    Returns:
+        Dictionary mapping each Secret key to its decoded value
+        
+    Raises:
+        pytest.fail: If a value is not valid base64-encoded UTF-8
+        
+    Example:
+        def test_api_key(decoded_secret):
+            assert decoded_secret['API_KEY'] == 'somesecretkey'
+    """
+    decoded = {}
+    for key, value in secret.get("data", {}).items():
+        try:
+            decoded[key] = base64.b64decode(value).decode('utf-8')
+        except ValueError as e:  # binascii.Error and UnicodeDecodeError
+            pytest.fail(f"Failed to decode {key} from base64: {e}")
+    return decoded
+
+
+@pytest.fixture(scope="session")
+def service(cluster_snapshot, service_name) -> Dict[str, Any]:
     """
     Fixture that provides the service object.
     
@@ -238,14 +539,14 @@ def service(service_name) -> Dict[str, Any]:
         def test_service_type(service):
             assert service['spec']['type'] in ['ClusterIP', 'NodePort']
     """
-    svc = get_service(service_name)
+    svc = cluster_snapshot.get("Service", service_name)
     if not svc:
         pytest.skip(f"Service '{service_name}' not found")
     return svc
 
 
-@pytest.fixture(scope="function")
-def ingress(ingress_name) -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def ingress(cluster_snapshot, ingress_name) -> Dict[str, Any]:
     """
     Fixture that provides the ingress object.
     
@@ -260,27 +561,29 @@ def ingress(ingress_name) -> Dict[str, Any]:
             rules = ingress['spec']['rules']
             assert len(rules) > 0
     """
-    ing = get_ingress(ingress_name)
+    ing = cluster_snapshot.get("Ingress", ingress_name)
     if not ing:
         pytest.skip(f"Ingress '{ingress_name}' not found")
     return ing
 
 
-@pytest.fixture(scope="function", autouse=False)
+@pytest.fixture(scope="function", autouse=True)
 def debug_on_failure(request, label_selector):
     """
     Fixture that prints debug information when a test fails.
     
-    Use by adding to test function parameters:
-        def test_something(debug_on_failure):
-            ...
-    
-    Or enable for all tests in a module by adding at top:
-        pytestmark = pytest.mark.usefixtures("debug_on_failure")
+    Applies to every test in test_k8s. The dump costs several kubectl calls
+    per failure, so it only runs when K8S_TEST_DEBUG_DUMP is set (CI sets
+    it; local runs stay fast):
+        K8S_TEST_DEBUG_DUMP=1 pytest test_k8s/
     """
     yield
     
-    if request.node.rep_call.failed:
+    if not os.environ.get("K8S_TEST_DEBUG_DUMP"):
+        return
+    
+    rep_call = getattr(request.node, "rep_call", None)
+    if rep_call is not None and rep_call.failed:
         print("\n" + "!" * 60)
         print("TEST FAILED - Printing debug information")
         print("!" * 60)
@@ -314,21 +617,9 @@ def wait_for_stable_state(label_selector):
             # Verify state...
     """
     def wait(desired_count: int, timeout: int = 60, poll_interval: int = 2) -> bool:
-        """Wait for desired number of pods to be running and ready."""
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            running = get_running_pods(label_selector)
-            if len(running) >= desired_count:
-                # Wait a bit more to ensure stability
-                time.sleep(poll_interval)
-                running_check = get_running_pods(label_selector)
-                if len(running_check) >= desired_count:
-                    return True
-            
-            time.sleep(poll_interval)
-        
-        return False
+        """Wait for desired number of pods to be running, ready and unchanging."""
+        return wait_for_pods_stable(desired_count, label_selector, timeout=timeout,
+                                    quiet_period=poll_interval)
     
     return wait
 
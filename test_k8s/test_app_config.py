@@ -2,11 +2,11 @@
 import pytest
 import requests
 
-from .utils import get_service, get_minikube_ip, get_running_pods
+from .utils import get_service, get_running_pods
 
 
 @pytest.mark.ingress
-def test_environment_variables_affect_app_response():
+def test_environment_variables_affect_app_response(http, minikube_ip):
     """
     Verify that the app can access and use environment variables from ConfigMap/Secret.
     
@@ -16,24 +16,19 @@ def test_environment_variables_affect_app_response():
     Note: This test requires the app to expose environment information via an endpoint.
     If the app doesn't have such an endpoint, this test will be skipped.
     """
-    # Get service access URL
-    minikube_ip = get_minikube_ip()
-    if not minikube_ip:
-        pytest.skip("Cannot get Minikube IP")
-    
     # Try to access an /env or /config endpoint if it exists
     # This is a future-proof test that would work if such endpoint is added
     url = f"http://{minikube_ip}"
     
     try:
         # First verify the main endpoint works
-        response = requests.get(url, headers={"Host": "hello-flask.local"}, timeout=5)
+        response = http.get(url, headers={"Host": "hello-flask.local"}, timeout=5)
         assert response.status_code == 200, f"Main endpoint failed: {response.status_code}"
         
         print("✓ App is accessible and responding")
         
         # Try to access a config/env endpoint (this may not exist yet)
-        env_response = requests.get(
+        env_response = http.get(
             f"{url}/env",
             headers={"Host": "hello-flask.local"},
             timeout=5
@@ -54,18 +49,19 @@ def test_environment_variables_affect_app_response():
         pytest.skip(f"Cannot connect to app: {e}")
 
 
-def test_pods_have_config_environment_available(pods):
+def test_pods_have_config_environment_available(session_running_pods):
     """
     Verify that pods have all expected configuration environment variables available.
     
     This ensures configuration is properly injected and available to the application,
-    even if the app doesn't explicitly use them yet.
+    even if the app doesn't explicitly use them yet. Every replica is checked;
+    the per-pod `env` execs run concurrently.
     """
-    from .utils import exec_in_pod
+    from .utils import get_pod_env, run_parallel
     
-    assert len(pods) > 0, "No pods found to test"
+    assert len(session_running_pods) > 0, "No pods found to test"
     
-    pod_name = pods[0]["metadata"]["name"]
+    pod_names = [pod["metadata"]["name"] for pod in session_running_pods]
     
     # All expected environment variables from ConfigMap and Secret
     expected_env_vars = {
@@ -82,19 +78,19 @@ def test_pods_have_config_environment_available(pods):
     missing_vars = []
     incorrect_vars = []
     
-    for env_var, expected_value in expected_env_vars.items():
-        result = exec_in_pod(pod_name, ["printenv", env_var])
-        
-        if result.returncode != 0:
-            missing_vars.append(env_var)
-            continue
-        
-        actual_value = result.stdout.strip()
-        if actual_value != expected_value:
-            incorrect_vars.append(f"{env_var}: expected '{expected_value}', got '{actual_value}'")
+    for pod_name, env in zip(pod_names, run_parallel(get_pod_env, pod_names)):
+        for env_var, expected_value in expected_env_vars.items():
+            if env_var not in env:
+                missing_vars.append(f"{pod_name}: {env_var}")
+                continue
+            
+            actual_value = env[env_var]
+            if actual_value != expected_value:
+                incorrect_vars.append(f"{pod_name}: {env_var}: expected '{expected_value}', got '{actual_value}'")
     
     # Assert all checks passed
     assert len(missing_vars) == 0, f"Missing environment variables: {missing_vars}"
     assert len(incorrect_vars) == 0, f"Incorrect values: {incorrect_vars}"
     
-    print(f"✓ All {len(expected_env_vars)} configuration environment variables are available to the app")
+    print(f"✓ All {len(expected_env_vars)} configuration environment variables are available "
+          f"in {len(pod_names)} pod(s)")
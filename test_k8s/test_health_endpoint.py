@@ -31,17 +31,23 @@ import requests
 import time
 from .utils import (
     run_kubectl,
-    get_service_url,
-    get_minikube_ip,
+    run_parallel,
     wait_for_pods_ready
 )
 
 
+def _timed_get(get, url):
+    """Issue one GET and return (response, elapsed seconds)."""
+    start_time = time.perf_counter()
+    response = get(url, timeout=5)
+    return response, time.perf_counter() - start_time
+
+
 class TestHealthEndpointDeployed:
     """Integration tests for deployed /health endpoint."""
     
     @pytest.mark.nodeport
-    def test_health_endpoint_via_nodeport(self):
+    def test_health_endpoint_via_nodeport(self, http, service_url):
         """
         Test /health endpoint is accessible via NodePort service.
         
@@ -49,12 +55,10 @@ class TestHealthEndpointDeployed:
         This simulates how Kubernetes liveness probe accesses the endpoint -
         direct pod HTTP access within the cluster network.
         """
-        # Get service URL
-        service_url = get_service_url("hello-flask")
         health_url = f"{service_url}/health"
         
         # Test health endpoint
-        response = requests.get(health_url, timeout=5)
+        response = http.get(health_url, timeout=5)
         
         assert response.status_code == 200, \
             f"Health endpoint should return 200, got {response.status_code}"
@@ -68,7 +72,7 @@ class TestHealthEndpointDeployed:
     
     
     @pytest.mark.ingress
-    def test_health_endpoint_via_ingress(self):
+    def test_health_endpoint_via_ingress(self, http, minikube_ip):
         """
         Test /health endpoint is accessible via Ingress.
         
@@ -77,13 +81,11 @@ class TestHealthEndpointDeployed:
         monitoring tools might access /health via Ingress. This verifies
         the health endpoint is externally accessible.
         """
-        # Get Minikube IP for Ingress access
-        minikube_ip = get_minikube_ip()
         health_url = f"http://{minikube_ip}/health"
         
         # Access via Ingress (using Host header)
         headers = {"Host": "hello-flask.local"}
-        response = requests.get(health_url, headers=headers, timeout=5)
+        response = http.get(health_url, headers=headers, timeout=5)
         
         assert response.status_code == 200, \
             f"Health via Ingress should return 200, got {response.status_code}"
@@ -93,7 +95,8 @@ class TestHealthEndpointDeployed:
     
     
     @pytest.mark.nodeport
-    def test_health_endpoint_performance_in_cluster(self):
+    @pytest.mark.serial
+    def test_health_endpoint_performance_in_cluster(self, http, service_url):
         """
         Test that /health responds within liveness probe timeout.
         
@@ -104,18 +107,15 @@ class TestHealthEndpointDeployed:
         
         Target: < 1s (5x safety margin from 5s timeout)
         """
-        service_url = get_service_url("hello-flask")
         health_url = f"{service_url}/health"
         
-        # Measure multiple requests to get average latency
-        latencies = []
-        for _ in range(10):
-            start_time = time.time()
-            response = requests.get(health_url, timeout=5)
-            end_time = time.time()
-            
+        # Measure multiple requests, one at a time, to get average latency
+        # (concurrent requests would also time queuing in the client pool)
+        results = [_timed_get(http.get, health_url) for _ in range(10)]
+        
+        for response, _ in results:
             assert response.status_code == 200
-            latencies.append(end_time - start_time)
+        latencies = [elapsed for _, elapsed in results]
         
         avg_latency = sum(latencies) / len(latencies)
         max_latency = max(latencies)
@@ -131,7 +131,7 @@ class TestHealthEndpointDeployed:
     
     
     @pytest.mark.nodeport
-    def test_health_consistency_across_replicas(self):
+    def test_health_consistency_across_replicas(self, service_url):
         """
         Test that /health returns same result from all replicas.
         
@@ -139,17 +139,19 @@ class TestHealthEndpointDeployed:
         With 3 replicas, NodePort service round-robins requests.
         All pods should return identical health status (stateless design).
         """
-        service_url = get_service_url("hello-flask")
         health_url = f"{service_url}/health"
         
-        # Make multiple requests (should hit different pods)
-        responses = []
-        for _ in range(15):  # With 3 replicas, should hit each ~5 times
+        # Make multiple concurrent requests (should hit different pods).
+        # Deliberately not the shared `http` session: kube-proxy balances
+        # per connection, so keep-alive would pin every request to one pod.
+        def fetch(_):
             response = requests.get(health_url, timeout=5)
-            responses.append({
+            return {
                 "status_code": response.status_code,
                 "content": response.json()
-            })
+            }
+        
+        responses = run_parallel(fetch, range(15))  # With 3 replicas, should hit each ~5 times
         
         # All should return 200
         for i, resp in enumerate(responses, 1):
@@ -160,7 +162,8 @@ class TestHealthEndpointDeployed:
     
     
     @pytest.mark.nodeport
-    def test_health_endpoint_during_pod_restart(self):
+    @pytest.mark.serial
+    def test_health_endpoint_during_pod_restart(self, http, service_url, pods):
         """
         Test health endpoint behavior during rolling update/restart.
         
@@ -171,25 +174,21 @@ class TestHealthEndpointDeployed:
         
         During restart, old pods serve traffic until new pods are ready.
         """
-        # Get current pods
-        result = run_kubectl("get", "pods", "-l", "app=hello-flask", "-o", "name")
-        initial_pods = [line for line in result.stdout.strip().split('\n') if line]
-        
-        assert len(initial_pods) >= 1, "Should have at least 1 replica"
+        # Current pods, from the watch-backed pod cache
+        assert len(pods) >= 1, "Should have at least 1 replica"
         
         # Trigger restart
         run_kubectl("rollout", "restart", "deployment/hello-flask")
         
         # Health endpoint should remain accessible during restart
         # (old pods serve until new pods ready)
-        service_url = get_service_url("hello-flask")
         health_url = f"{service_url}/health"
         
         # Poll health during restart
         accessible_count = 0
         for _ in range(20):  # Check over 20 seconds
             try:
-                response = requests.get(health_url, timeout=2)
+                response = http.get(health_url, timeout=2)
                 if response.status_code == 200:
                     accessible_count += 1
             except requests.exceptions.RequestException:
@@ -201,17 +200,18 @@ class TestHealthEndpointDeployed:
         assert accessible_count >= 15, \
             f"Health was only accessible {accessible_count}/20 times during restart"
         
-        # Wait for rollout to complete
+        # Wait for rollout to complete (kubectl watches the Deployment, no polling)
         run_kubectl("rollout", "status", "deployment/hello-flask", "--timeout=60s")
         
         # Verify health works after restart
-        response = requests.get(health_url, timeout=5)
+        response = http.get(health_url, timeout=5)
         assert response.status_code == 200
         assert response.json() == {"status": "healthy"}
     
     
     @pytest.mark.nodeport
-    def test_health_vs_root_response_time_comparison(self):
+    @pytest.mark.serial
+    def test_health_vs_root_response_time_comparison(self, http, service_url):
         """
         Compare /health vs / endpoint performance.
         
@@ -222,21 +222,10 @@ class TestHealthEndpointDeployed:
         
         This demonstrates why we use separate endpoints for probes.
         """
-        service_url = get_service_url("hello-flask")
-        
-        # Measure /health
-        health_latencies = []
-        for _ in range(10):
-            start = time.time()
-            requests.get(f"{service_url}/health", timeout=5)
-            health_latencies.append(time.time() - start)
-        
-        # Measure /
-        root_latencies = []
-        for _ in range(10):
-            start = time.time()
-            requests.get(f"{service_url}/", timeout=5)
-            root_latencies.append(time.time() - start)
+        # Measure /health, then /, one request at a time so each sample is
+        # the server's response time rather than time queued in the client
+        health_latencies = [_timed_get(http.get, f"{service_url}/health")[1] for _ in range(10)]
+        root_latencies = [_timed_get(http.get, f"{service_url}/")[1] for _ in range(10)]
         
         avg_health = sum(health_latencies) / len(health_latencies)
         avg_root = sum(root_latencies) / len(root_latencies)
@@ -252,7 +241,7 @@ class TestHealthEndpointDeployed:
     
     
     @pytest.mark.nodeport
-    def test_health_endpoint_without_readiness(self):
+    def test_health_endpoint_without_readiness(self, http, service_url):
         """
         Test that /health endpoint works even if readiness probe fails.
         
@@ -267,11 +256,9 @@ class TestHealthEndpointDeployed:
         # This test verifies /health is a separate endpoint from /
         # In this app, both always succeed, but architecture supports independence
         
-        service_url = get_service_url("hello-flask")
-        
         # Both endpoints should work
-        health_response = requests.get(f"{service_url}/health", timeout=5)
-        root_response = requests.get(f"{service_url}/", timeout=5)
+        health_response = http.get(f"{service_url}/health", timeout=5)
+        root_response = http.get(f"{service_url}/", timeout=5)
         
         assert health_response.status_code == 200
         assert root_response.status_code == 200
@@ -290,7 +277,7 @@ class TestHealthEndpointEducational:
     """Educational tests demonstrating health check concepts."""
     
     @pytest.mark.nodeport
-    def test_liveness_probe_configuration_matches_health_endpoint(self):
+    def test_liveness_probe_configuration_matches_health_endpoint(self, http, service_url, main_container):
         """
         Verify deployment's liveness probe configuration matches /health behavior.
         
@@ -300,14 +287,8 @@ class TestHealthEndpointEducational:
         2. Flask route (/health)
         3. Actual runtime behavior
         """
-        # Get deployment config
-        result = run_kubectl(
-            "get", "deployment", "hello-flask",
-            "-o", "jsonpath={.spec.template.spec.containers[0].livenessProbe}"
-        )
-        
-        import json
-        liveness_config = json.loads(result.stdout)
+        # Get deployment config (from the session's cluster snapshot)
+        liveness_config = main_container["livenessProbe"]
         
         # Verify configuration
         assert liveness_config["httpGet"]["path"] == "/health", \
@@ -316,10 +297,9 @@ class TestHealthEndpointEducational:
         assert liveness_config["timeoutSeconds"] == 5
         
         # Verify endpoint actually exists and responds fast enough
-        service_url = get_service_url("hello-flask")
-        start = time.time()
-        response = requests.get(f"{service_url}/health", timeout=5)
-        latency = time.time() - start
+        start = time.perf_counter()
+        response = http.get(f"{service_url}/health", timeout=5)
+        latency = time.perf_counter() - start
         
         assert response.status_code == 200, \
             "Health endpoint must return 200 for liveness probe"
@@ -335,7 +315,7 @@ class TestHealthEndpointEducational:
     
     
     @pytest.mark.educational
-    def test_demonstrate_probe_frequency(self):
+    def test_demonstrate_probe_frequency(self, deployment, main_container):
         """
         Demonstrate how often Kubernetes probes the health endpoint.
         
@@ -346,19 +326,9 @@ class TestHealthEndpointEducational:
         
         Health endpoints must be lightweight!
         """
-        # Get probe config
-        result = run_kubectl(
-            "get", "deployment", "hello-flask",
-            "-o", "jsonpath={.spec.template.spec.containers[0].livenessProbe.periodSeconds}"
-        )
-        period_seconds = int(result.stdout.strip())
-        
-        # Get replica count
-        result = run_kubectl(
-            "get", "deployment", "hello-flask",
-            "-o", "jsonpath={.spec.replicas}"
-        )
-        replicas = int(result.stdout.strip())
+        # Get probe config and replica count from the session's deployment
+        period_seconds = main_container["livenessProbe"]["periodSeconds"]
+        replicas = deployment["spec"]["replicas"]
         
         # Calculate probe frequency
         probes_per_minute_per_pod = 60 / period_seconds
@@ -1,9 +1,6 @@
 """Test Ingress resource configuration and status."""
-import time
 import pytest
 
-from .utils import get_ingress, run_kubectl
-
 
 @pytest.mark.ingress
 def test_ingress_exists(ingress):
@@ -41,34 +38,19 @@ def test_ingress_has_rules(ingress, service_name):
 
 
 @pytest.mark.ingress
-def test_ingress_has_address(ingress_name, k8s_timeouts):
+def test_ingress_has_address(ingress_address, k8s_timeouts):
     """
     Check that Ingress has been assigned an address.
     
     This indicates the Ingress controller is working and has processed the resource.
+    The wait (up to the ingress_ready timeout) runs in the background from
+    the start of the session, see the ingress_address fixture.
     """
-    # Wait up to timeout for address to be assigned
     max_wait = k8s_timeouts.get('ingress_ready', 60)
-    
-    for i in range(max_wait):
-        ing = get_ingress(ingress_name)
-        
-        if not ing:
-            time.sleep(1)
-            continue
-        
-        # Check for address in status
-        load_balancer = ing.get("status", {}).get("loadBalancer", {})
-        ingress_list = load_balancer.get("ingress", [])
-        
-        if ingress_list and len(ingress_list) > 0:
-            address = ingress_list[0].get("ip") or ingress_list[0].get("hostname")
-            if address:
-                print(f"✓ Ingress has address: {address}")
-                return
-        
-        if i < max_wait - 1:
-            time.sleep(1)
+    address = ingress_address.result()
+    if address:
+        print(f"✓ Ingress has address: {address}")
+        return
     
     # If we get here, no address was assigned
     pytest.fail(
@@ -10,49 +10,38 @@ Note: Readiness probe tests are in test_readiness_probe.py
 """
 import pytest
 
-from .utils import get_deployment, get_pods, get_running_pods
 
-
-def test_liveness_probe_configured(deployment):
+def test_liveness_probe_configured(main_container):
     """Verify that liveness probe is configured in the deployment."""
-    containers = deployment["spec"]["template"]["spec"]["containers"]
-    
-    assert len(containers) > 0, "No containers found in deployment"
-    
-    main_container = containers[0]
     assert "livenessProbe" in main_container, "Liveness probe not configured"
     
     liveness_probe = main_container["livenessProbe"]
     
     # Verify liveness probe configuration
     assert "httpGet" in liveness_probe, "Liveness probe should use httpGet"
-    assert liveness_probe["httpGet"]["path"] == "/health", "Liveness probe path should be /health"
-    assert liveness_probe["httpGet"]["port"] == 5000, "Liveness probe port should be 5000"
+    http_get = liveness_probe["httpGet"]
+    assert http_get["path"] == "/health", "Liveness probe path should be /health"
+    assert http_get["port"] == 5000, "Liveness probe port should be 5000"
     
     # Verify probe timing settings
-    assert "initialDelaySeconds" in liveness_probe, "initialDelaySeconds should be configured"
-    assert "periodSeconds" in liveness_probe, "periodSeconds should be configured"
-    assert "timeoutSeconds" in liveness_probe, "timeoutSeconds should be configured"
-    assert "failureThreshold" in liveness_probe, "failureThreshold should be configured"
+    missing = {"initialDelaySeconds", "periodSeconds", "timeoutSeconds", "failureThreshold"} - liveness_probe.keys()
+    assert not missing, f"Liveness probe settings should be configured: {sorted(missing)}"
     
     print("\n✅ Liveness probe configuration:")
-    print(f"   Path: {liveness_probe['httpGet']['path']}")
-    print(f"   Port: {liveness_probe['httpGet']['port']}")
+    print(f"   Path: {http_get['path']}")
+    print(f"   Port: {http_get['port']}")
     print(f"   Initial Delay: {liveness_probe['initialDelaySeconds']}s")
     print(f"   Period: {liveness_probe['periodSeconds']}s")
     print(f"   Timeout: {liveness_probe['timeoutSeconds']}s")
     print(f"   Failure Threshold: {liveness_probe['failureThreshold']}")
 
 
-def test_liveness_probe_restarts_unhealthy_containers(deployment):
+def test_liveness_probe_restarts_unhealthy_containers(deployment, session_running_pods):
     """Verify that containers have been restarted by liveness probe if unhealthy."""
     # This test checks the restart count to verify liveness probe is working
     # Note: In a healthy system, restart count may be 0, which is expected
     
-    from .utils import get_running_pods
-    
-    label_selector = "app=hello-flask"
-    pods = get_running_pods(label_selector)
+    pods = session_running_pods
     
     assert len(pods) > 0, "No running pods found"
     
@@ -8,34 +8,26 @@ This test verifies that:
 """
 import pytest
 
-from .utils import get_deployment, get_pods, get_running_pods
 
-
-def test_readiness_probe_configured(deployment):
+def test_readiness_probe_configured(main_container):
     """Verify that readiness probe is configured in the deployment."""
-    containers = deployment["spec"]["template"]["spec"]["containers"]
-    
-    assert len(containers) > 0, "No containers found in deployment"
-    
-    main_container = containers[0]
     assert "readinessProbe" in main_container, "Readiness probe not configured"
     
     readiness_probe = main_container["readinessProbe"]
     
     # Verify readiness probe configuration
     assert "httpGet" in readiness_probe, "Readiness probe should use httpGet"
-    assert readiness_probe["httpGet"]["path"] == "/ready", "Readiness probe path should be /ready"
-    assert readiness_probe["httpGet"]["port"] == 5000, "Readiness probe port should be 5000"
+    http_get = readiness_probe["httpGet"]
+    assert http_get["path"] == "/ready", "Readiness probe path should be /ready"
+    assert http_get["port"] == 5000, "Readiness probe port should be 5000"
     
     # Verify probe timing settings
-    assert "initialDelaySeconds" in readiness_probe, "initialDelaySeconds should be configured"
-    assert "periodSeconds" in readiness_probe, "periodSeconds should be configured"
-    assert "timeoutSeconds" in readiness_probe, "timeoutSeconds should be configured"
-    assert "failureThreshold" in readiness_probe, "failureThreshold should be configured"
+    missing = {"initialDelaySeconds", "periodSeconds", "timeoutSeconds", "failureThreshold"} - readiness_probe.keys()
+    assert not missing, f"Readiness probe settings should be configured: {sorted(missing)}"
     
     print("\n✅ Readiness probe configuration:")
-    print(f"   Path: {readiness_probe['httpGet']['path']}")
-    print(f"   Port: {readiness_probe['httpGet']['port']}")
+    print(f"   Path: {http_get['path']}")
+    print(f"   Port: {http_get['port']}")
     print(f"   Initial Delay: {readiness_probe['initialDelaySeconds']}s")
     print(f"   Period: {readiness_probe['periodSeconds']}s")
     print(f"   Timeout: {readiness_probe['timeoutSeconds']}s")
@@ -53,11 +45,11 @@ def test_ready_replicas_match_desired(deployment):
     print(f"\n✅ Deployment has {ready_replicas}/{desired_replicas} ready replicas")
 
 
-def test_all_running_pods_are_ready(running_pods, deployment):
+def test_all_running_pods_are_ready(session_running_pods, deployment):
     """Verify that all running pods have passed readiness checks."""
-    assert len(running_pods) > 0, "No running pods found"
+    assert len(session_running_pods) > 0, "No running pods found"
     
-    for pod in running_pods:
+    for pod in session_running_pods:
         pod_name = pod["metadata"]["name"]
         
         # Check pod conditions for Ready status
@@ -71,4 +63,4 @@ def test_all_running_pods_are_ready(running_pods, deployment):
         assert ready_condition["status"] == "True", \
             f"Pod {pod_name} is not ready (status={ready_condition['status']})"
     
-    print(f"\n✅ All {len(running_pods)} running pod(s) are ready")
+    print(f"\n✅ All {len(session_running_pods)} running pod(s) are ready")
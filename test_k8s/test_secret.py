@@ -1,8 +1,13 @@
 """Test Secret integration with pods."""
-import base64
 import pytest
 
-from .utils import exec_in_pod, deployment_references_resource
+from .utils import deployment_references_resource
+
+# Expected decoded Secret values (k8s/secret.yaml), checked in the resource and in pods
+SECRET_VALUES = [
+    ("API_KEY", "somesecretkey"),
+    ("DB_PASSWORD", "password123"),
+]
 
 
 def test_secret_exists(secret, secret_name):
@@ -19,40 +24,28 @@ def test_secret_has_correct_keys(secret):
     """Verify that the Secret contains the expected keys."""
     data = secret.get("data", {})
     
-    # Check expected keys exist
-    expected_keys = ["API_KEY", "DB_PASSWORD"]
-    for key in expected_keys:
-        assert key in data, f"Secret missing expected key: {key}"
+    # Check expected keys exist (all missing keys are reported at once)
+    missing = {key for key, _ in SECRET_VALUES} - data.keys()
+    assert not missing, f"Secret missing expected keys: {sorted(missing)}"
     
     print(f"✓ Secret has correct keys: {list(data.keys())}")
 
 
-def test_secret_values_are_base64_encoded(secret):
+@pytest.mark.parametrize("key,expected_decoded", SECRET_VALUES, ids=[key for key, _ in SECRET_VALUES])
+def test_secret_values_are_base64_encoded(secret, decoded_secret, key, expected_decoded):
     """Verify that Secret values are properly base64-encoded."""
     data = secret.get("data", {})
     
-    # Test each value can be decoded from base64
-    expected_decoded_values = {
-        "API_KEY": "somesecretkey",
-        "DB_PASSWORD": "password123"
-    }
+    assert key in data, f"Secret missing key: {key}"
+    
+    # Decoded once per session; invalid base64 fails in the fixture
+    decoded_value = decoded_secret[key]
     
-    for key, expected_decoded in expected_decoded_values.items():
-        assert key in data, f"Secret missing key: {key}"
-        
-        encoded_value = data[key]
-        
-        # Verify it's valid base64
-        try:
-            decoded_value = base64.b64decode(encoded_value).decode('utf-8')
-        except Exception as e:
-            pytest.fail(f"Failed to decode {key} from base64: {e}")
-        
-        # Verify decoded value matches expected
-        assert decoded_value == expected_decoded, \
-            f"Expected {key} to decode to '{expected_decoded}', got '{decoded_value}'"
+    # Verify decoded value matches expected
+    assert decoded_value == expected_decoded, \
+        f"Expected {key} to decode to '{expected_decoded}', got '{decoded_value}'"
     
-    print(f"✓ All Secret values are correctly base64-encoded")
+    print(f"✓ Secret value {key} is correctly base64-encoded")
 
 
 def test_deployment_references_secret(deployment, secret_name):
@@ -63,40 +56,14 @@ def test_deployment_references_secret(deployment, secret_name):
     print(f"✓ Deployment correctly references Secret '{secret_name}'")
 
 
-def test_secret_applied(running_pods):
-    """Verify that Secret environment variables are applied to pods."""
-    assert len(running_pods) > 0, "No running pods found to test Secret"
-    
-    pod_name = running_pods[0]["metadata"]["name"]
-    
-    # Execute printenv in the pod to check API_KEY variable
-    result = exec_in_pod(pod_name, ["printenv", "API_KEY"])
-    env_value = result.stdout.strip()
-    
-    # The value in the pod should be decoded (not base64)
-    assert env_value == "somesecretkey", \
-        f"Expected API_KEY='somesecretkey', got '{env_value}'"
-    
-    print(f"✓ Secret applied: API_KEY={env_value}")
-
-
-def test_all_secret_values_in_pods(running_pods):
-    """Verify that all Secret values are correctly injected into pods (decoded)."""
-    assert len(running_pods) > 0, "No running pods found to test Secret"
-    
-    pod_name = running_pods[0]["metadata"]["name"]
-    
-    # Test all expected environment variables (should be decoded in pod)
-    expected_env_vars = {
-        "API_KEY": "somesecretkey",
-        "DB_PASSWORD": "password123"
-    }
+@pytest.mark.parametrize("key,value", SECRET_VALUES, ids=[key for key, _ in SECRET_VALUES])
+def test_secret_applied(pod_env, key, value):
+    """Verify that each Secret value is injected into the pods' environment (decoded)."""
+    # One `env` dump per session serves every parameter.
+    # The value in the pod should be decoded (not base64).
+    env_value = pod_env.get(key)
     
-    for env_var, expected_value in expected_env_vars.items():
-        result = exec_in_pod(pod_name, ["printenv", env_var])
-        actual_value = result.stdout.strip()
-        
-        assert actual_value == expected_value, \
-            f"Expected {env_var}='{expected_value}', got '{actual_value}'"
+    assert env_value == value, \
+        f"Expected {key}='{value}', got '{env_value}'"
     
-    print(f"✓ All Secret values correctly injected into pods (decoded): {list(expected_env_vars.keys())}")
+    print(f"✓ Secret applied: {key} is set")
@@ -5,10 +5,9 @@ This test verifies that the Flask application can be reached through
 a NodePort service type using Minikube's service URL feature.
 """
 import requests
-import time
 import pytest
 
-from .utils import get_service, get_service_url
+from .utils import wait_for_service_url
 
 
 @pytest.mark.nodeport
@@ -26,7 +25,7 @@ def test_service_is_nodeport(service):
 
 
 @pytest.mark.nodeport
-def test_nodeport_service_reachable(service, k8s_timeouts):
+def test_nodeport_service_reachable(http, service, k8s_timeouts):
     """
     Test that the service is reachable via NodePort.
     
@@ -39,13 +38,8 @@ def test_nodeport_service_reachable(service, k8s_timeouts):
     
     print(f"Testing NodePort service accessibility...")
     
-    # Get the service URL from Minikube
-    url = None
-    for attempt in range(5):
-        url = get_service_url("hello-flask")
-        if url:
-            break
-        time.sleep(1)
+    # Get the service URL from Minikube (retried with backoff)
+    url = wait_for_service_url("hello-flask")
     
     assert url, (
         "minikube returned an empty URL for service 'hello-flask'. "
@@ -61,7 +55,7 @@ def test_nodeport_service_reachable(service, k8s_timeouts):
     timeout = k8s_timeouts.get('http_request', 5)
     
     try:
-        resp = requests.get(url, timeout=timeout)
+        resp = http.get(url, timeout=timeout)
         assert resp.status_code == 200, \
             f"Unexpected status {resp.status_code} from {url}"
         assert "Hello" in resp.text, \
@@ -4,11 +4,50 @@ Shared utilities for Kubernetes testing.
 This module provides common helper functions used across multiple test files
 to reduce code duplication and improve maintainability.
 """
-import json
+import calendar
 import os
+import queue
+import shutil
+import socket
 import subprocess
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+from urllib.parse import urlencode
+
+
+# orjson (already an app dependency) parses kubectl's JSON output several
+# times faster than the stdlib; fall back to json where it is missing.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# The official Kubernetes client is optional. When it is installed and a
+# kubeconfig is available, pod lookups and execs go straight to the API
+# server over one pooled connection instead of launching kubectl each time.
+try:
+    from kubernetes import client as k8s_client, config as k8s_config
+    from kubernetes.client.rest import ApiException
+    from kubernetes.stream import stream as k8s_stream
+    from kubernetes.watch import Watch as K8sWatch
+    from urllib3.exceptions import HTTPError as Urllib3HTTPError
+except ImportError:
+    k8s_client = None
+else:
+    # Raised by the client when the API server cannot be reached at all
+    # (MaxRetryError, refused connections, timeouts). kubectl may still get
+    # through, e.g. via a proxy or exec credential the client does not support.
+    _API_UNREACHABLE = (Urllib3HTTPError, OSError)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Upper bound on concurrent kubectl processes, to stay clear of API server
+# client-side throttling.
+MAX_PARALLEL_KUBECTL = 8
 
 
 class KubectlError(Exception):
@@ -16,14 +55,15 @@ class KubectlError(Exception):
     pass
 
 
-def run_kubectl(*args: str, check: bool = True, use_minikube: bool = False) -> subprocess.CompletedProcess:
+def run_kubectl(*args: str, check: bool = True, text: bool = True) -> subprocess.CompletedProcess:
     """
     Run a kubectl command and return the result.
     
     Args:
         *args: Arguments to pass to kubectl
         check: If True, raise KubectlError on non-zero exit code
-        use_minikube: If True, use 'minikube kubectl --' instead of 'kubectl'
+        text: If False, stdout and stderr are left as bytes. JSON parsers
+            take bytes directly, which saves decoding large outputs.
         
     Returns:
         CompletedProcess with stdout, stderr, and returncode
@@ -35,34 +75,94 @@ def run_kubectl(*args: str, check: bool = True, use_minikube: bool = False) -> s
         result = run_kubectl("get", "pods", "-o", "json")
         pods = json.loads(result.stdout)
     """
-    if use_minikube:
-        cmd = ["minikube", "kubectl", "--"] + list(args)
-    else:
-        cmd = ["kubectl"] + list(args)
+    cmd = (*_kubectl_command(), *args)
     
     result = subprocess.run(
         cmd,
+        stdin=subprocess.DEVNULL,  # Never wait on the terminal
         capture_output=True,
-        text=True
+        text=text
     )
     
     if check and result.returncode != 0:
+        stderr = result.stderr if text else result.stderr.decode(errors="replace")
         raise KubectlError(
             f"kubectl command failed: {' '.join(args)}\n"
             f"Exit code: {result.returncode}\n"
-            f"Stderr: {result.stderr}"
+            f"Stderr: {stderr}"
         )
     
     return result
 
 
-def get_pods(label_selector: str = "app=hello-flask", namespace: str = "default") -> List[Dict[str, Any]]:
+@lru_cache(maxsize=None)
+def _kubectl_command() -> Tuple[str, ...]:
+    """
+    Resolve the kubectl command line prefix once per process.
+    
+    The K8S_CONTEXT environment variable, if set, pins the context so
+    kubectl does not resolve the current one on every call.
+    """
+    context = os.environ.get("K8S_CONTEXT")
+    return (shutil.which("kubectl") or "kubectl",) + (("--context", context) if context else ())
+
+
+@lru_cache(maxsize=None)
+def get_core_api() -> Optional[Any]:
+    """
+    Get a shared CoreV1Api client, created once per process.
+    
+    Returns:
+        CoreV1Api instance, or None if the kubernetes package is not
+        installed or no cluster configuration is found (callers then
+        fall back to kubectl)
+        
+    Example:
+        api = get_core_api()
+        if api:
+            pods = api.list_namespaced_pod("default")
+    """
+    if k8s_client is None:
+        return None
+    
+    try:
+        k8s_config.load_kube_config(context=os.environ.get("K8S_CONTEXT"))
+    except (k8s_config.ConfigException, OSError):
+        try:
+            k8s_config.load_incluster_config()
+        except k8s_config.ConfigException:
+            return None
+    
+    return k8s_client.CoreV1Api(k8s_client.ApiClient())
+
+
+def _api_json(response) -> Dict[str, Any]:
+    """
+    Parse a raw (_preload_content=False) API response.
+    
+    Raw JSON keeps the same camelCase dictionaries kubectl returns, so
+    callers work unchanged whichever backend served them.
+    """
+    return _json_loads(response.data)
+
+
+def get_pods(
+    label_selector: str = "app=hello-flask",
+    namespace: str = "default",
+    consistent: bool = False
+) -> List[Dict[str, Any]]:
     """
     Get all pods matching the label selector.
     
+    By default the list is served from the API server's watch cache
+    (resourceVersion=0) rather than a quorum read from etcd; it may lag
+    the latest write by a moment, which status polling tolerates.
+    
     Args:
         label_selector: Kubernetes label selector (default: "app=hello-flask")
         namespace: Kubernetes namespace (default: "default")
+        consistent: If True, skip all caches and read the latest state from
+            etcd, e.g. right after deleting a pod (default: False)
         
     Returns:
         List of pod dictionaries from Kubernetes API
@@ -75,15 +175,45 @@ def get_pods(label_selector: str = "app=hello-flask", namespace: str = "default"
         for pod in pods:
             print(pod['metadata']['name'])
     """
-    result = run_kubectl(
-        "get", "pods",
-        "-l", label_selector,
-        "-n", namespace,
-        "-o", "json",
-        check=True
-    )
+    if not consistent:
+        cache = _pod_caches.get((label_selector, namespace))
+        if cache is not None:
+            return cache.pods()
+    return _list_pods(label_selector, namespace, consistent)
+
+
+def _list_pods(label_selector: str, namespace: str, consistent: bool = False) -> List[Dict[str, Any]]:
+    """LIST pods from the API server (or kubectl), bypassing any PodCache."""
+    api = get_core_api()
+    if api is not None:
+        kwargs = {} if consistent else {"resource_version": "0"}
+        try:
+            return _api_json(api.list_namespaced_pod(
+                namespace, label_selector=label_selector,
+                _preload_content=False, _request_timeout=5, **kwargs
+            )).get("items", [])
+        except ApiException as e:
+            raise KubectlError(f"Listing pods failed: {e.status} {e.reason}") from e
+        except _API_UNREACHABLE:
+            pass  # Fall back to kubectl below
+    
+    if consistent:
+        result = run_kubectl(
+            "get", "pods",
+            "-l", label_selector,
+            "-n", namespace,
+            "-o", "json",
+            check=True, text=False
+        )
+    else:
+        # kubectl get has no resourceVersion flag; the raw list URL takes it
+        query = urlencode({"labelSelector": label_selector, "resourceVersion": "0"})
+        result = run_kubectl(
+            "get", "--raw", f"/api/v1/namespaces/{namespace}/pods?{query}",
+            check=True, text=False
+        )
     
-    data = json.loads(result.stdout)
+    data = _json_loads(result.stdout)
     return data.get("items", [])
 
 
@@ -103,17 +233,30 @@ def get_pod_by_name(pod_name: str, namespace: str = "default") -> Optional[Dict[
         if pod:
             print(pod['status']['phase'])
     """
+    cached = _cached_pod(pod_name, namespace)
+    if cached is not None:
+        return cached
+    
+    api = get_core_api()
+    if api is not None:
+        try:
+            return _api_json(api.read_namespaced_pod(pod_name, namespace, _preload_content=False))
+        except ApiException:
+            return None
+        except _API_UNREACHABLE:
+            pass  # Fall back to kubectl below
+    
     result = run_kubectl(
         "get", "pod", pod_name,
         "-n", namespace,
         "-o", "json",
-        check=False
+        check=False, text=False
     )
     
     if result.returncode != 0:
         return None
     
-    return json.loads(result.stdout)
+    return _json_loads(result.stdout)
 
 
 def get_pod_restart_count(pod_name: str, namespace: str = "default") -> Optional[int]:
@@ -131,14 +274,43 @@ def get_pod_restart_count(pod_name: str, namespace: str = "default") -> Optional
         restart_count = get_pod_restart_count("hello-flask-abc123")
         print(f"Pod has restarted {restart_count} times")
     """
+    if get_core_api() is None and _cached_pod(pod_name, namespace) is None:
+        # Only the one field is printed, so there is no pod JSON to parse here
+        result = run_kubectl(
+            "get", "pod", pod_name,
+            "-n", namespace,
+            "-o", "jsonpath={.status.containerStatuses[0].restartCount}",
+            check=False
+        )
+        if result.returncode != 0:
+            return None
+        return int(result.stdout.strip() or 0)
+    
     pod = get_pod_by_name(pod_name, namespace)
     if not pod:
         return None
     
-    container_statuses = pod.get("status", {}).get("containerStatuses", [])
-    if not container_statuses:
-        return 0
+    return restart_count_of(pod)
+
+
+def restart_count_of(pod: Dict[str, Any]) -> int:
+    """
+    Get the restart count of a pod's first container from a pod object.
     
+    Use this on pods already in hand (from a listing, cache or watch event)
+    instead of fetching the pod again with get_pod_restart_count().
+    
+    Args:
+        pod: Pod dictionary
+        
+    Returns:
+        Restart count (0 if no container status is reported yet)
+        
+    Example:
+        for pod in get_pods():
+            print(pod["metadata"]["name"], restart_count_of(pod))
+    """
+    container_statuses = pod.get("status", {}).get("containerStatuses") or [{}]
     return container_statuses[0].get("restartCount", 0)
 
 
@@ -160,14 +332,364 @@ def get_running_pods(label_selector: str = "app=hello-flask", namespace: str = "
     """
     pods = get_pods(label_selector, namespace)
     
-    running_pods = [
-        pod for pod in pods
-        if pod["status"]["phase"] == "Running" and
+    running_pods = [pod for pod in pods if _is_running_and_ready(pod)]
+    
+    return running_pods
+
+
+def get_pod_statuses(label_selector: str = "app=hello-flask", namespace: str = "default") -> List[Tuple[str, str, bool]]:
+    """
+    Get the name, phase and readiness of each pod matching the label selector.
+    
+    Without the API client, kubectl prints just these fields as columns,
+    so polling loops neither download nor parse full pod JSON.
+    
+    Args:
+        label_selector: Kubernetes label selector (default: "app=hello-flask")
+        namespace: Kubernetes namespace (default: "default")
+        
+    Returns:
+        List of (name, phase, ready) tuples; ready means running, all
+        containers ready and not terminating
+        
+    Raises:
+        KubectlError: If kubectl command fails
+        
+    Example:
+        ready = sum(ready for _, _, ready in get_pod_statuses())
+    """
+    if get_core_api() is not None:
+        return [
+            (pod["metadata"]["name"], pod["status"].get("phase", ""), _is_running_and_ready(pod))
+            for pod in get_pods(label_selector, namespace)
+        ]
+    
+    result = run_kubectl(
+        "get", "pods",
+        "-l", label_selector,
+        "-n", namespace,
+        "-o", "custom-columns=NAME:.metadata.name,PHASE:.status.phase,"
+              "READY:.status.containerStatuses[*].ready,DELETING:.metadata.deletionTimestamp",
+        "--no-headers",
+        check=True
+    )
+    
+    statuses = []
+    for line in result.stdout.splitlines():
+        fields = line.split()
+        if len(fields) != 4:
+            continue
+        name, phase, ready, deleting = fields
+        statuses.append((
+            name,
+            phase,
+            phase == "Running" and all(r == "true" for r in ready.split(",")) and deleting == "<none>",
+        ))
+    return statuses
+
+
+def _is_running_and_ready(pod: Dict[str, Any]) -> bool:
+    """Return True if the pod is Running, all containers are ready, and it is not terminating."""
+    return (
+        pod["status"]["phase"] == "Running" and
         all(cs.get("ready", False) for cs in pod["status"].get("containerStatuses", [])) and
         pod["metadata"].get("deletionTimestamp") is None  # Exclude terminating pods
+    )
+
+
+def watch_pods(
+    label_selector: str = "app=hello-flask",
+    namespace: str = "default",
+    timeout: int = 60
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Stream pod events from `kubectl get pods --watch`.
+    
+    The API server pushes every change as it happens, so waiters react
+    immediately instead of re-listing pods on a fixed interval. Existing
+    pods are reported first as ADDED events.
+    
+    Args:
+        label_selector: Kubernetes label selector (default: "app=hello-flask")
+        namespace: Kubernetes namespace (default: "default")
+        timeout: Seconds after which kubectl closes the watch (default: 60)
+        
+    Yields:
+        (event_type, pod) tuples, event_type being ADDED, MODIFIED or DELETED
+        
+    Raises:
+        OSError: If kubectl cannot be started
+        
+    Example:
+        for event_type, pod in watch_pods(timeout=30):
+            print(event_type, pod["metadata"]["name"])
+    """
+    proc = _start_pod_watch(label_selector, namespace, timeout)
+    try:
+        yield from _read_watch_events(proc.stdout)
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def wait_for_pod_event(
+    predicate: Callable[[str, Dict[str, Any]], bool],
+    label_selector: str = "app=hello-flask",
+    namespace: str = "default",
+    timeout: int = 60,
+    resource_version: Optional[str] = None
+) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Wait for the first pod event that matches a predicate.
+    
+    One watch connection receives changes as they happen, so the caller
+    reacts within milliseconds instead of on the next poll.
+    
+    Args:
+        predicate: Called with (event_type, pod); return True to stop
+        label_selector: Kubernetes label selector (default: "app=hello-flask")
+        namespace: Kubernetes namespace (default: "default")
+        timeout: Maximum time to wait in seconds (default: 60)
+        resource_version: Watch only changes after this resourceVersion
+            (API client only). Without it existing pods are first replayed
+            as ADDED events, so predicates should ignore those.
+        
+    Returns:
+        The matching (event_type, pod) tuple, or None if the timeout passed
+        or the watch could not be opened
+        
+    Example:
+        rv = pod_cache.resource_version
+        delete_pod(name)
+        event = wait_for_pod_event(
+            lambda t, pod: t == "DELETED" and pod["metadata"]["name"] == name,
+            resource_version=rv,
+        )
+    """
+    api = get_core_api()
+    if api is not None:
+        # return_type="object" leaves event objects as plain dicts instead of
+        # building V1Pod models; the callers only read the raw dictionaries.
+        events = (
+            (event["type"], event["raw_object"])
+            for event in K8sWatch(return_type="object").stream(
+                api.list_namespaced_pod, namespace,
+                label_selector=label_selector,
+                resource_version=resource_version,
+                timeout_seconds=int(timeout)
+            )
+            if event["type"] in ("ADDED", "MODIFIED", "DELETED")
+        )
+    else:
+        events = watch_pods(label_selector, namespace, timeout)
+    
+    try:
+        for event_type, pod in events:
+            if predicate(event_type, pod):
+                return event_type, pod
+    except Exception:
+        pass  # Watch unavailable or dropped; callers may fall back to polling
+    finally:
+        events.close()  # Close the watch connection / kubectl process
+    return None
+
+
+def _start_pod_watch(label_selector: str, namespace: str, timeout: int) -> subprocess.Popen:
+    """Start `kubectl get pods --watch` emitting one JSON document per event."""
+    cmd = [
+        *_kubectl_command(), "get", "pods", "-l", label_selector, "-n", namespace,
+        "--watch", "--output-watch-events", "-o", "json",
+        f"--request-timeout={int(timeout)}s",
     ]
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+
+
+def _read_watch_events(stream) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Parse (event_type, object) tuples from a kubectl watch output stream."""
+    # kubectl pretty-prints one JSON document per event; a document ends
+    # with a closing brace in the first column.
+    lines = []
+    for line in stream:
+        lines.append(line)
+        if line.rstrip() == "}":
+            event = _json_loads("".join(lines))
+            lines = []
+            if event.get("type") in ("ADDED", "MODIFIED", "DELETED"):
+                yield event["type"], event["object"]
+
+
+# Synced PodCaches by (label_selector, namespace); pod lookups read from
+# these instead of asking the API server again.
+_pod_caches: Dict[Tuple[str, str], "PodCache"] = {}
+
+
+def _cached_pod(pod_name: str, namespace: str) -> Optional[Dict[str, Any]]:
+    """Return a pod from any running PodCache in the namespace, or None."""
+    for (_, cache_namespace), cache in list(_pod_caches.items()):
+        if cache_namespace == namespace:
+            pod = cache.get(pod_name)
+            if pod is not None:
+                return pod
+    return None
+
+
+class PodCache:
+    """
+    Informer-style local cache of the app's pods.
     
-    return running_pods
+    One LIST fills the cache, then a background WATCH applies every change,
+    so repeated pod lookups are answered from memory instead of the API
+    server. Uses the Kubernetes client when available, otherwise
+    `kubectl get pods --watch`. Until the first LIST succeeds, lookups fall
+    back to a live LIST.
+    
+    While synced, the cache also answers get_pods(), get_pod_by_name() and
+    get_pod_restart_count() for its selector and namespace.
+    
+    Example:
+        cache = PodCache("app=hello-flask").start()
+        cache.wait_for_sync(timeout=30)
+        print([p["metadata"]["name"] for p in cache.pods()])
+        cache.stop()
+    """
+    
+    def __init__(self, label_selector: str = "app=hello-flask", namespace: str = "default"):
+        self.label_selector = label_selector
+        self.namespace = namespace
+        self.synced = threading.Event()
+        self._first_list_done = threading.Event()
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._pods: Dict[str, Dict[str, Any]] = {}
+        # Last resourceVersion seen (API client only); watches started from
+        # it report only changes made after that point
+        self.resource_version: Optional[str] = None
+        self._watch = None
+        self._proc: Optional[subprocess.Popen] = None  # kubectl watch (no API client)
+        self._thread = threading.Thread(target=self._run, name="pod-cache", daemon=True)
+    
+    def start(self) -> "PodCache":
+        """Start the background list/watch thread."""
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        """Stop watching; the thread exits at its next event or stream timeout."""
+        self._stopped.set()
+        if _pod_caches.get((self.label_selector, self.namespace)) is self:
+            del _pod_caches[(self.label_selector, self.namespace)]
+        if self._watch is not None:
+            self._watch.stop()
+        proc = self._proc
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+    
+    def wait_for_sync(self, timeout: float = 30) -> bool:
+        """Wait for the initial LIST; return True if the cache is populated."""
+        self._first_list_done.wait(timeout)
+        return self.synced.is_set()
+    
+    def pods(self) -> List[Dict[str, Any]]:
+        """Return a snapshot of all cached pods (waiting for the first LIST if it is in flight)."""
+        if not self._first_list_done.is_set() and self._thread.is_alive():
+            self._first_list_done.wait(30)
+        if not self.synced.is_set():
+            return _list_pods(self.label_selector, self.namespace)
+        with self._lock:
+            return list(self._pods.values())
+    
+    def get(self, pod_name: str) -> Optional[Dict[str, Any]]:
+        """Return the cached pod with this name, or None if unknown or not synced."""
+        if not self.synced.is_set():
+            return None
+        with self._lock:
+            return self._pods.get(pod_name)
+    
+    def running_pods(self) -> List[Dict[str, Any]]:
+        """Return a snapshot of the cached pods that are running and ready."""
+        return [pod for pod in self.pods() if _is_running_and_ready(pod)]
+    
+    def _list(self) -> Optional[str]:
+        """Replace the cache contents with a fresh LIST; return its resourceVersion."""
+        api = get_core_api()
+        if api is not None:
+            # resourceVersion=0 serves the LIST from the API server's watch
+            # cache; the watch then continues from the version it returns
+            data = _api_json(api.list_namespaced_pod(
+                self.namespace, label_selector=self.label_selector,
+                resource_version="0", _preload_content=False
+            ))
+            items, resource_version = data.get("items", []), data["metadata"].get("resourceVersion")
+        else:
+            items, resource_version = _list_pods(self.label_selector, self.namespace), None
+        with self._lock:
+            self._pods = {pod["metadata"]["name"]: pod for pod in items}
+        return resource_version
+    
+    def _events(self, resource_version: Optional[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (event_type, pod) changes after the LIST."""
+        api = get_core_api()
+        if api is None:
+            # Keep the process handle so stop() can end the watch at once
+            self._proc = _start_pod_watch(self.label_selector, self.namespace, timeout=300)
+            try:
+                if self._stopped.is_set():
+                    return
+                yield from _read_watch_events(self._proc.stdout)
+            finally:
+                self._proc.kill()
+                self._proc.wait()
+            return
+        self._watch = K8sWatch(return_type="object")
+        for event in self._watch.stream(
+            api.list_namespaced_pod, self.namespace,
+            label_selector=self.label_selector,
+            resource_version=resource_version,
+            timeout_seconds=300
+        ):
+            if event["type"] in ("ADDED", "MODIFIED", "DELETED"):
+                yield event["type"], event["raw_object"]
+    
+    def _run(self) -> None:
+        resource_version = None
+        while not self._stopped.is_set():
+            if resource_version is None:
+                try:
+                    resource_version = self._list()
+                except Exception:
+                    if not self.synced.is_set():
+                        self._first_list_done.set()
+                        return  # No cluster: lookups keep falling back to a live LIST
+                    time.sleep(1)
+                    continue
+                self.resource_version = resource_version
+                if not self.synced.is_set():
+                    self.synced.set()
+                    if not self._stopped.is_set():
+                        _pod_caches.setdefault((self.label_selector, self.namespace), self)
+                self._first_list_done.set()
+            
+            try:
+                for event_type, pod in self._events(resource_version):
+                    name = pod["metadata"]["name"]
+                    with self._lock:
+                        if event_type == "DELETED":
+                            self._pods.pop(name, None)
+                        else:
+                            self._pods[name] = pod
+                    if resource_version is not None:
+                        resource_version = pod["metadata"].get("resourceVersion", resource_version)
+                        self.resource_version = resource_version
+                    if self._stopped.is_set():
+                        return
+            except Exception as e:
+                # 410 Gone: resourceVersion too old, re-LIST right away
+                if getattr(e, "status", None) != 410:
+                    time.sleep(1)
+                resource_version = None
+            # Stream ended (server timeout): the API watch resumes from the
+            # last resourceVersion; kubectl has none, so it re-LISTs
 
 
 def wait_for_pods_ready(
@@ -175,17 +697,23 @@ def wait_for_pods_ready(
     label_selector: str = "app=hello-flask",
     namespace: str = "default",
     timeout: int = 60,
-    poll_interval: int = 2
+    poll_interval: float = 2
 ) -> bool:
     """
     Wait for a specific number of pods to be running and ready.
     
+    Pod events are streamed from `kubectl get pods --watch` (watch_pods(),
+    even when the API client is available), so this returns as soon as the
+    count is reached. Polling with get_pod_statuses() is only used if the
+    watch closes before the timeout or kubectl cannot be run or parsed; it
+    starts at 0.25s and backs off to poll_interval.
+    
     Args:
         desired_count: Number of pods expected to be ready
         label_selector: Kubernetes label selector (default: "app=hello-flask")
         namespace: Kubernetes namespace (default: "default")
         timeout: Maximum time to wait in seconds (default: 60)
-        poll_interval: Time between checks in seconds (default: 2)
+        poll_interval: Longest time between checks when polling (default: 2)
         
     Returns:
         True if desired count reached, False if timeout
@@ -198,43 +726,206 @@ def wait_for_pods_ready(
     """
     start_time = time.time()
     
+    pods = {}
+    try:
+        for event_type, pod in watch_pods(label_selector, namespace, timeout):
+            name = pod["metadata"]["name"]
+            if event_type == "DELETED":
+                pods.pop(name, None)
+            else:
+                pods[name] = pod
+            if sum(_is_running_and_ready(p) for p in pods.values()) >= desired_count:
+                return True
+    except (OSError, ValueError):
+        pass  # kubectl unavailable or unparseable output
+    
+    # The watch closed early (e.g. dropped connection); fall back to polling
+    delay = min(0.25, poll_interval)
     while time.time() - start_time < timeout:
-        running_pods = get_running_pods(label_selector, namespace)
+        ready_count = sum(ready for _, _, ready in get_pod_statuses(label_selector, namespace))
         
-        if len(running_pods) >= desired_count:
+        if ready_count >= desired_count:
             return True
         
-        time.sleep(poll_interval)
+        time.sleep(max(0, min(delay, start_time + timeout - time.time())))
+        delay = min(delay * 2, poll_interval)
     
     return False
 
 
-def get_deployment(name: str, namespace: str = "default") -> Optional[Dict[str, Any]]:
+def _seconds_since_ready(pod: Dict[str, Any]) -> float:
+    """Seconds since the pod's Ready condition last changed (0 if unknown)."""
+    for condition in pod["status"].get("conditions", []):
+        if condition.get("type") == "Ready" and condition.get("lastTransitionTime"):
+            changed = calendar.timegm(time.strptime(condition["lastTransitionTime"], "%Y-%m-%dT%H:%M:%SZ"))
+            return max(0.0, time.time() - changed)
+    return 0.0
+
+
+def wait_for_pods_stable(
+    desired_count: int,
+    label_selector: str = "app=hello-flask",
+    namespace: str = "default",
+    timeout: int = 60,
+    quiet_period: float = 2
+) -> bool:
     """
-    Get a deployment by name.
+    Wait until enough pods are ready and have stopped changing.
+    
+    The state is stable once at least desired_count pods are running and
+    ready and no pod has changed for quiet_period seconds. Changes are
+    seen through a watch, and a pod's Ready transition time counts as its
+    last change, so an already-settled deployment returns at once rather
+    than always sleeping through a fixed double-check.
     
     Args:
-        name: Name of the deployment
+        desired_count: Number of pods expected to be ready
+        label_selector: Kubernetes label selector (default: "app=hello-flask")
         namespace: Kubernetes namespace (default: "default")
+        timeout: Maximum time to wait in seconds (default: 60)
+        quiet_period: Seconds without pod changes that count as stable (default: 2)
         
     Returns:
-        Deployment dictionary or None if not found
+        True if a stable state was reached, False if timeout
+        
+    Raises:
+        OSError: If kubectl cannot be started
         
     Example:
-        deployment = get_deployment("hello-flask")
-        replicas = deployment['spec']['replicas']
+        if wait_for_pods_stable(2, timeout=60):
+            print("Deployment has settled")
     """
+    deadline = time.monotonic() + timeout
+    pods = {pod["metadata"]["name"]: pod for pod in get_pods(label_selector, namespace)}
+    youngest = min((_seconds_since_ready(pod) for pod in pods.values()), default=0.0)
+    last_change = time.monotonic() - youngest
+    
+    # Read the watch on a helper thread so the main loop can wait on a timeout
+    events: "queue.Queue[Optional[Tuple[str, Dict[str, Any]]]]" = queue.Queue()
+    proc = _start_pod_watch(label_selector, namespace, timeout)
+    
+    def pump():
+        try:
+            for event in _read_watch_events(proc.stdout):
+                events.put(event)
+        except (OSError, ValueError):
+            pass
+        events.put(None)  # Stream closed
+    
+    threading.Thread(target=pump, daemon=True).start()
+    try:
+        while True:
+            now = time.monotonic()
+            ready = sum(_is_running_and_ready(p) for p in pods.values()) >= desired_count
+            if ready and now - last_change >= quiet_period:
+                return True
+            if now >= deadline:
+                return False
+            
+            wait = deadline - now
+            if ready:
+                wait = min(wait, last_change + quiet_period - now)
+            try:
+                event = events.get(timeout=wait)
+            except queue.Empty:
+                continue
+            if event is None:
+                break
+            
+            event_type, pod = event
+            name = pod["metadata"]["name"]
+            known = pods.get(name)
+            if event_type == "DELETED":
+                pods.pop(name, None)
+            elif known is not None and \
+                    known["metadata"].get("resourceVersion") == pod["metadata"].get("resourceVersion"):
+                continue  # Replay of the initial listing, not a change
+            else:
+                pods[name] = pod
+            last_change = time.monotonic()
+    finally:
+        proc.kill()
+        proc.wait()
+    
+    # The watch closed early; fall back to a ready check plus a re-check
+    remaining = max(0, int(deadline - time.monotonic()))
+    if wait_for_pods_ready(desired_count, label_selector, namespace, timeout=remaining):
+        time.sleep(quiet_period)
+        return sum(ready for _, _, ready in get_pod_statuses(label_selector, namespace)) >= desired_count
+    return False
+
+
+# kubectl resource type -> (API group class, read method) for named reads
+_API_READERS = {
+    "deployment": ("AppsV1Api", "read_namespaced_deployment"),
+    "service": ("CoreV1Api", "read_namespaced_service"),
+    "ingress": ("NetworkingV1Api", "read_namespaced_ingress"),
+    "configmap": ("CoreV1Api", "read_namespaced_config_map"),
+    "secret": ("CoreV1Api", "read_namespaced_secret"),
+}
+
+
+@lru_cache(maxsize=None)
+def _group_api(group: str) -> Optional[Any]:
+    """
+    Get a shared client for an API group (e.g. "AppsV1Api").
+    
+    All groups share the ApiClient of get_core_api(), so they reuse one
+    connection pool. Returns None whenever get_core_api() does.
+    """
+    core = get_core_api()
+    if core is None:
+        return None
+    return getattr(k8s_client, group)(core.api_client)
+
+
+def _get_resource(resource_type: str, name: str, namespace: str) -> Optional[Dict[str, Any]]:
+    """
+    Get one named resource of a type listed in _API_READERS.
+    
+    Over the API client this is a GET on a kept-alive connection, rather
+    than a kubectl launch with its own TLS handshake; kubectl is the
+    fallback.
+    """
+    group, method = _API_READERS[resource_type]
+    api = _group_api(group)
+    if api is not None:
+        try:
+            return _api_json(getattr(api, method)(name, namespace, _preload_content=False))
+        except ApiException:
+            return None
+        except _API_UNREACHABLE:
+            pass  # Fall back to kubectl below
+    
     result = run_kubectl(
-        "get", "deployment", name,
+        "get", resource_type, name,
         "-n", namespace,
         "-o", "json",
-        check=False
+        check=False, text=False
     )
     
     if result.returncode != 0:
         return None
     
-    return json.loads(result.stdout)
+    return _json_loads(result.stdout)
+
+
+def get_deployment(name: str, namespace: str = "default") -> Optional[Dict[str, Any]]:
+    """
+    Get a deployment by name.
+    
+    Args:
+        name: Name of the deployment
+        namespace: Kubernetes namespace (default: "default")
+        
+    Returns:
+        Deployment dictionary or None if not found
+        
+    Example:
+        deployment = get_deployment("hello-flask")
+        replicas = deployment['spec']['replicas']
+    """
+    return _get_resource("deployment", name, namespace)
 
 
 def get_service(name: str, namespace: str = "default") -> Optional[Dict[str, Any]]:
@@ -252,17 +943,7 @@ def get_service(name: str, namespace: str = "default") -> Optional[Dict[str, Any
         service = get_service("hello-flask")
         service_type = service['spec']['type']
     """
-    result = run_kubectl(
-        "get", "service", name,
-        "-n", namespace,
-        "-o", "json",
-        check=False
-    )
-    
-    if result.returncode != 0:
-        return None
-    
-    return json.loads(result.stdout)
+    return _get_resource("service", name, namespace)
 
 
 def get_ingress(name: str, namespace: str = "default") -> Optional[Dict[str, Any]]:
@@ -281,23 +962,193 @@ def get_ingress(name: str, namespace: str = "default") -> Optional[Dict[str, Any
         if ingress:
             rules = ingress['spec']['rules']
     """
+    return _get_resource("ingress", name, namespace)
+
+
+def _ingress_address_of(ingress: Dict[str, Any]) -> Optional[str]:
+    """Return the first load balancer IP or hostname of an ingress, or None."""
+    entry = (ingress.get("status", {}).get("loadBalancer", {}).get("ingress") or [{}])[0]
+    return entry.get("ip") or entry.get("hostname") or None
+
+
+def watch_ingress(name: str, namespace: str = "default", timeout: int = 60) -> Iterator[Dict[str, Any]]:
+    """
+    Stream an ingress's current state, then every change to it.
+    
+    Uses a field-selected API watch when the Kubernetes client is
+    available, `kubectl get ingress --watch` otherwise.
+    
+    Args:
+        name: Name of the ingress
+        namespace: Kubernetes namespace (default: "default")
+        timeout: Seconds after which the watch is closed (default: 60)
+        
+    Yields:
+        Ingress dictionaries, first the current one, then one per update
+        
+    Example:
+        for ingress in watch_ingress("hello-flask-ingress", timeout=30):
+            print(ingress["status"])
+    """
+    timeout = max(1, int(timeout))  # 0 would mean "no timeout" to the API server
+    api = _group_api("NetworkingV1Api")
+    if api is not None:
+        events = K8sWatch(return_type="object").stream(
+            api.list_namespaced_ingress, namespace,
+            field_selector=f"metadata.name={name}",
+            timeout_seconds=timeout
+        )
+        try:
+            for event in events:
+                if event["type"] in ("ADDED", "MODIFIED"):
+                    yield event["raw_object"]
+        finally:
+            events.close()
+        return
+    
+    cmd = [
+        *_kubectl_command(), "get", "ingress", name, "-n", namespace,
+        "--watch", "--output-watch-events", "-o", "json",
+        f"--request-timeout={timeout}s",
+    ]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    try:
+        for event_type, ingress in _read_watch_events(proc.stdout):
+            if event_type != "DELETED":
+                yield ingress
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def wait_for_ingress_address(
+    name: str,
+    namespace: str = "default",
+    timeout: float = 60,
+    stop: Optional[threading.Event] = None
+) -> Optional[str]:
+    """
+    Wait until an ingress has been assigned an address.
+    
+    The ingress is watched, so this returns as soon as the controller
+    writes the address. The watch is reopened every few seconds to notice
+    `stop`; if it cannot be opened (e.g. the ingress does not exist yet),
+    retries back off from 0.1s up to 5s.
+    
+    Args:
+        name: Name of the ingress
+        namespace: Kubernetes namespace (default: "default")
+        timeout: Maximum seconds to wait (default: 60)
+        stop: Optional event that ends the wait early when set
+        
+    Returns:
+        Address string, or None if none was assigned in time
+        
+    Example:
+        address = wait_for_ingress_address("hello-flask-ingress", timeout=30)
+    """
+    stop = stop or threading.Event()
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while not stop.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        
+        segment = max(1, int(min(remaining, 5)))
+        started = time.monotonic()
+        try:
+            for ingress in watch_ingress(name, namespace, segment):
+                address = _ingress_address_of(ingress)
+                if address:
+                    return address
+                if stop.is_set():
+                    return None
+        except Exception:
+            pass  # Watch unavailable or dropped; retry below
+        
+        if time.monotonic() - started < segment:
+            # The watch ended early: back off before reopening it
+            if stop.wait(min(delay, max(deadline - time.monotonic(), 0))):
+                return None
+            delay = min(delay * 2, 5)
+    return None
+
+
+def get_resources(*refs: str, namespace: str = "default") -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Get several named resources at once.
+    
+    With the API client the reads run concurrently over its connection
+    pool; otherwise a single kubectl call fetches them all. Resources that
+    do not exist are simply absent from the result.
+    
+    Args:
+        *refs: Resources as "type/name" (e.g. "deployment/hello-flask")
+        namespace: Kubernetes namespace (default: "default")
+        
+    Returns:
+        Dictionary mapping (kind, name) to the resource dictionary
+        
+    Example:
+        resources = get_resources("deployment/hello-flask", "service/hello-flask")
+        deployment = resources.get(("Deployment", "hello-flask"))
+    """
+    parsed = [ref.split("/", 1) for ref in refs]
+    if get_core_api() is not None and all(rtype in _API_READERS for rtype, _ in parsed):
+        fetched = run_parallel(lambda ref: _get_resource(ref[0], ref[1], namespace), parsed)
+        return {(item["kind"], item["metadata"]["name"]): item for item in fetched if item}
+    
     result = run_kubectl(
-        "get", "ingress", name,
+        "get", *refs,
         "-n", namespace,
+        "--ignore-not-found",
         "-o", "json",
-        check=False
+        check=False, text=False
     )
     
-    if result.returncode != 0:
-        return None
+    if result.returncode != 0 or not result.stdout.strip():
+        return {}
     
-    return json.loads(result.stdout)
+    data = _json_loads(result.stdout)
+    # A single ref returns the object itself rather than a List
+    items = data.get("items", []) if data.get("kind") == "List" else [data]
+    return {(item["kind"], item["metadata"]["name"]): item for item in items}
 
 
+class ClusterSnapshot:
+    """
+    Cached view of the app's named resources, fetched together once.
+    
+    Read-only tests look resources up here instead of running kubectl each
+    time. Tests that change a resource call refresh() to re-read it.
+    
+    Example:
+        snapshot = ClusterSnapshot(["deployment/hello-flask", "service/hello-flask"])
+        deployment = snapshot.get("Deployment", "hello-flask")
+    """
+    
+    def __init__(self, refs: List[str], namespace: str = "default"):
+        self.refs = list(refs)
+        self.namespace = namespace
+        self.refresh()
+    
+    def refresh(self) -> None:
+        """Re-read all resources from the cluster."""
+        self._resources = get_resources(*self.refs, namespace=self.namespace)
+    
+    def get(self, kind: str, name: str) -> Optional[Dict[str, Any]]:
+        """Return the resource of the given kind and name, or None if not found."""
+        return self._resources.get((kind, name))
+
+
+@lru_cache(maxsize=None)
 def is_ci_environment() -> bool:
     """
     Detect if running in CI/CD environment.
     
+    The environment does not change during a run, so the result is cached.
+    
     Returns:
         True if running in CI/CD, False otherwise
         
@@ -308,10 +1159,18 @@ def is_ci_environment() -> bool:
     return os.getenv('CI') == 'true' or os.getenv('GITHUB_ACTIONS') == 'true'
 
 
+_minikube_ip: Optional[str] = None
+
+
 def get_minikube_ip() -> Optional[str]:
     """
     Get the Minikube cluster IP address.
     
+    The IP is fixed for the life of the cluster, so once `minikube ip`
+    succeeds the result is reused for the test session. Failures are not
+    cached, so a call made while the cluster is still starting can be
+    retried.
+    
     Returns:
         IP address string or None if command fails
         
@@ -319,22 +1178,82 @@ def get_minikube_ip() -> Optional[str]:
         ip = get_minikube_ip()
         url = f"http://{ip}:30000"
     """
+    global _minikube_ip
+    if _minikube_ip:
+        return _minikube_ip
+    
     result = subprocess.run(
         ["minikube", "ip"],
         capture_output=True,
         text=True
     )
     
-    if result.returncode != 0:
+    if result.returncode != 0 or not result.stdout.strip():
         return None
     
-    return result.stdout.strip()
+    _minikube_ip = result.stdout.strip()
+    return _minikube_ip
+
+
+def get_ingress_url_and_host(ingress: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get the URL and Host header for reaching the app through an Ingress.
+    
+    In CI/CD environments, uses Minikube IP directly (the hostname does
+    not resolve there). In local development, the ingress hostname is
+    resolved once here (e.g. via /etc/hosts) and the URL uses the address,
+    so requests never repeat the lookup; the Host header selects the rule.
+    
+    Args:
+        ingress: Ingress dictionary
+        
+    Returns:
+        (url, host_header) tuple, or (None, None) if the Ingress has no rules
+        
+    Example:
+        url, host = get_ingress_url_and_host(ingress)
+        response = requests.get(url, headers={"Host": host})
+    """
+    rules = ingress.get("spec", {}).get("rules", [])
+    if not rules:
+        return None, None
+    
+    # Get the configured hostname from ingress rules
+    ingress_host = rules[0].get("host", "hello-flask.local")
+    
+    # In CI/CD: Use Minikube IP instead of hostname (DNS won't resolve)
+    if is_ci_environment():
+        print("Detected CI environment - using Minikube IP instead of hostname")
+        minikube_ip = get_minikube_ip()
+        
+        if minikube_ip:
+            print(f"Using Minikube IP: {minikube_ip} with Host header: {ingress_host}")
+            # Return IP-based URL but also return the host header to use
+            return f"http://{minikube_ip}", ingress_host
+        else:
+            print("Warning: Could not get Minikube IP, falling back to hostname")
+    
+    # Local development: Resolve the ingress hostname once
+    try:
+        address = socket.getaddrinfo(ingress_host, 80, type=socket.SOCK_STREAM)[0][4][0]
+    except OSError:
+        print(f"Warning: Could not resolve {ingress_host}, using the hostname")
+        return f"http://{ingress_host}", ingress_host
+    
+    print(f"Using Ingress hostname: {ingress_host} ({address})")
+    return f"http://[{address}]" if ":" in address else f"http://{address}", ingress_host
+
+
+_service_urls: Dict[Tuple[str, str], str] = {}
 
 
 def get_service_url(service_name: str, namespace: str = "default") -> Optional[str]:
     """
     Get the URL for a Minikube service (NodePort or LoadBalancer).
     
+    Successful lookups are cached per service for the test session;
+    failures are not, so callers can retry while a service comes up.
+    
     Args:
         service_name: Name of the service
         namespace: Kubernetes namespace (default: "default")
@@ -347,6 +1266,10 @@ def get_service_url(service_name: str, namespace: str = "default") -> Optional[s
         if url:
             response = requests.get(url)
     """
+    key = (service_name, namespace)
+    if key in _service_urls:
+        return _service_urls[key]
+    
     result = subprocess.run(
         ["minikube", "service", service_name, "--url", "-n", namespace],
         capture_output=True,
@@ -354,16 +1277,99 @@ def get_service_url(service_name: str, namespace: str = "default") -> Optional[s
         timeout=10
     )
     
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    
+    _service_urls[key] = result.stdout.strip()
+    return _service_urls[key]
+
+
+def wait_for_service_url(service_name: str, namespace: str = "default", attempts: int = 6) -> Optional[str]:
+    """
+    Get the URL for a Minikube service, retrying while it comes up.
+    
+    Retries back off exponentially (0.1s, 0.2s, 0.4s, ...), so a URL that
+    appears just after a failed lookup is picked up quickly instead of
+    after a fixed one-second sleep.
+    
+    Args:
+        service_name: Name of the service
+        namespace: Kubernetes namespace (default: "default")
+        attempts: Maximum number of lookups (default: 6, about 3s of waiting)
+        
+    Returns:
+        Service URL or None if every lookup failed
+        
+    Example:
+        url = wait_for_service_url("hello-flask")
+    """
+    delay = 0.1
+    for attempt in range(attempts):
+        url = get_service_url(service_name, namespace)
+        if url or attempt == attempts - 1:
+            return url
+        time.sleep(delay)
+        delay *= 2
+    return None
+
+
+def service_proxy_get(
+    service_name: str, port: int, path: str = "", namespace: str = "default"
+) -> Optional[Tuple[int, bytes]]:
+    """
+    GET a path on a service through the API server's service proxy.
+    
+    Reaches a ClusterIP service from outside the cluster over the existing
+    API connection: no port-forward process, local port or wait for it.
+    
+    Args:
+        service_name: Name of the service
+        port: Service port (number or name)
+        path: Path below the service root, without a leading slash
+            (default: "" for the root)
+        namespace: Kubernetes namespace (default: "default")
+        
+    Returns:
+        (status_code, body) tuple, or None if the request could not be made
+        
+    Example:
+        status, body = service_proxy_get("hello-flask", 5000)
+    """
+    proxy_name = f"{service_name}:{port}"
+    api = get_core_api()
+    if api is not None:
+        try:
+            response = api.connect_get_namespaced_service_proxy_with_path(
+                proxy_name, namespace, path, _preload_content=False
+            )
+        except ApiException as e:
+            body = e.body or b""
+            return e.status, body.encode() if isinstance(body, str) else body
+        return response.status, response.data
+    
+    # kubectl --raw only succeeds on 2xx and does not report the status
+    result = run_kubectl(
+        "get", "--raw", f"/api/v1/namespaces/{namespace}/services/{proxy_name}/proxy/{path}",
+        check=False, text=False
+    )
+    
     if result.returncode != 0:
         return None
     
-    return result.stdout.strip()
+    return 200, result.stdout
 
 
 def exec_in_pod(pod_name: str, command: List[str], namespace: str = "default", check: bool = True) -> subprocess.CompletedProcess:
     """
     Execute a command inside a pod.
     
+    Uses the Kubernetes API client's exec stream when available, otherwise
+    `kubectl exec`; either way the result is a CompletedProcess.
+    
+    The exec stream temporarily swaps the request method of the ApiClient
+    it is given, so each exec gets its own client rather than the shared
+    one that watch threads and concurrent reads are using.
+    
     Args:
         pod_name: Name of the pod
         command: Command to execute (as list)
@@ -381,7 +1387,96 @@ def exec_in_pod(pod_name: str, command: List[str], namespace: str = "default", c
         print(result.stdout)
     """
     args = ["exec", pod_name, "-n", namespace, "--"] + command
-    return run_kubectl(*args, check=check)
+    
+    if get_core_api() is None:
+        return run_kubectl(*args, check=check)
+    
+    # get_core_api() has loaded the kubeconfig into the default configuration
+    api_client = k8s_client.ApiClient()
+    try:
+        ws = k8s_stream(
+            k8s_client.CoreV1Api(api_client).connect_get_namespaced_pod_exec, pod_name, namespace,
+            command=command, stdin=False, stdout=True, stderr=True, tty=False,
+            _preload_content=False
+        )
+        ws.run_forever(timeout=60)
+        returncode = ws.returncode  # None while the command is still running
+        stdout, stderr = ws.read_stdout(), ws.read_stderr()
+        ws.close()
+        if returncode is None:
+            returncode, stderr = 1, stderr + "exec timed out after 60s"
+        result = subprocess.CompletedProcess(["kubectl"] + args, returncode, stdout, stderr)
+    except Exception as e:  # ApiException, websocket errors (e.g. the process was killed)
+        result = subprocess.CompletedProcess(["kubectl"] + args, 1, "", str(e))
+    finally:
+        api_client.close()
+    
+    if check and result.returncode != 0:
+        raise KubectlError(
+            f"kubectl command failed: {' '.join(args)}\n"
+            f"Exit code: {result.returncode}\n"
+            f"Stderr: {result.stderr}"
+        )
+    
+    return result
+
+
+@lru_cache(maxsize=None)
+def get_pod_env(pod_name: str, namespace: str = "default") -> Dict[str, str]:
+    """
+    Get the full environment of a pod's container with a single exec.
+    
+    One `env` dump replaces a `printenv VAR` exec per variable. A pod's
+    environment is fixed for its lifetime (pods get new names when
+    recreated), so results are cached per pod for the test session; treat
+    the returned dict as read-only.
+    
+    Args:
+        pod_name: Name of the pod
+        namespace: Kubernetes namespace (default: "default")
+        
+    Returns:
+        Dictionary of environment variable names to values
+        
+    Raises:
+        KubectlError: If the exec fails
+        
+    Example:
+        env = get_pod_env("hello-flask-abc123")
+        assert env["APP_ENV"] == "local"
+    """
+    result = exec_in_pod(pod_name, ["env"], namespace=namespace)
+    env = {}
+    for line in result.stdout.splitlines():
+        name, sep, value = line.partition("=")
+        if sep:
+            env[name] = value
+    return env
+
+
+def run_parallel(func: Callable[[T], R], items: Iterable[T], max_workers: int = MAX_PARALLEL_KUBECTL) -> List[R]:
+    """
+    Call func on every item concurrently and return the results in order.
+    
+    kubectl calls spend nearly all their time waiting on the API server, so
+    overlapping them turns N round-trips of wall time into roughly one.
+    
+    Args:
+        func: Function to call with each item
+        items: Arguments, one call per item
+        max_workers: Maximum concurrent calls (default: MAX_PARALLEL_KUBECTL)
+        
+    Returns:
+        List of results, in the same order as items
+        
+    Raises:
+        Exception: The first exception raised by any call, when results are collected
+        
+    Example:
+        envs = run_parallel(get_pod_env, ["hello-flask-abc123", "hello-flask-def456"])
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
 
 
 def delete_pod(pod_name: str, namespace: str = "default", wait: bool = False) -> bool:
@@ -400,6 +1495,14 @@ def delete_pod(pod_name: str, namespace: str = "default", wait: bool = False) ->
         if delete_pod("hello-flask-abc123"):
             print("Pod deleted successfully")
     """
+    api = get_core_api()
+    if api is not None and not wait:
+        try:
+            api.delete_namespaced_pod(pod_name, namespace, _preload_content=False)
+        except ApiException:
+            return False
+        return True
+    
     wait_arg = "true" if wait else "false"
     result = run_kubectl(
         "delete", "pod", pod_name,
@@ -427,6 +1530,17 @@ def get_pod_logs(pod_name: str, namespace: str = "default", tail: Optional[int]
         logs = get_pod_logs("hello-flask-abc123", tail=50)
         print(logs)
     """
+    api = get_core_api()
+    if api is not None:
+        kwargs = {"tail_lines": tail} if tail else {}
+        try:
+            response = api.read_namespaced_pod_log(pod_name, namespace, _preload_content=False, **kwargs)
+            return response.data.decode(errors="replace")
+        except ApiException:
+            return None
+        except _API_UNREACHABLE:
+            pass  # Fall back to kubectl below
+    
     args = ["logs", pod_name, "-n", namespace]
     if tail:
         args.extend(["--tail", str(tail)])
@@ -443,6 +1557,10 @@ def print_debug_info(label_selector: str = "app=hello-flask", namespace: str = "
     """
     Print useful debugging information about pods and deployment.
     
+    The pod listing runs concurrently with one get_resources() call for the
+    deployment and service, and restart counts are read from the pod
+    listing rather than one lookup per pod.
+    
     Args:
         label_selector: Kubernetes label selector (default: "app=hello-flask")
         namespace: Kubernetes namespace (default: "default")
@@ -450,25 +1568,31 @@ def print_debug_info(label_selector: str = "app=hello-flask", namespace: str = "
     Example:
         print_debug_info()  # Prints current state of all hello-flask resources
     """
+    # The lookups are independent, so run them concurrently and print after
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pods_future = executor.submit(get_pods, label_selector, namespace)
+        resources_future = executor.submit(
+            get_resources, "deployment/hello-flask", "service/hello-flask", namespace=namespace
+        )
+    
     print("\n" + "="*60)
     print("DEBUG INFORMATION")
     print("="*60)
     
     # Pods
     try:
-        pods = get_pods(label_selector, namespace)
+        pods = pods_future.result()
         print(f"\nPods ({len(pods)} total):")
         for pod in pods:
             name = pod['metadata']['name']
             phase = pod['status']['phase']
-            restart_count = get_pod_restart_count(name, namespace) or 0
-            print(f"  - {name}: {phase} (restarts: {restart_count})")
+            print(f"  - {name}: {phase} (restarts: {restart_count_of(pod)})")
     except Exception as e:
         print(f"  Error getting pods: {e}")
     
     # Deployment
     try:
-        deployment = get_deployment("hello-flask", namespace)
+        deployment = resources_future.result().get(("Deployment", "hello-flask"))
         if deployment:
             desired = deployment['spec']['replicas']
             ready = deployment['status'].get('readyReplicas', 0)
@@ -478,7 +1602,7 @@ def print_debug_info(label_selector: str = "app=hello-flask", namespace: str = "
     
     # Service
     try:
-        service = get_service("hello-flask", namespace)
+        service = resources_future.result().get(("Service", "hello-flask"))
         if service:
             svc_type = service['spec']['type']
             print(f"\nService: type={svc_type}")
@@ -508,17 +1632,7 @@ def get_configmap(name: str, namespace: str = "default") -> Optional[Dict[str, A
             data = configmap.get("data", {})
             print(f"APP_ENV: {data.get('APP_ENV')}")
     """
-    result = run_kubectl(
-        "get", "configmap", name,
-        "-n", namespace,
-        "-o", "json",
-        check=False
-    )
-    
-    if result.returncode != 0:
-        return None
-    
-    return json.loads(result.stdout)
+    return _get_resource("configmap", name, namespace)
 
 
 def get_secret(name: str, namespace: str = "default") -> Optional[Dict[str, Any]]:
@@ -542,17 +1656,7 @@ def get_secret(name: str, namespace: str = "default") -> Optional[Dict[str, Any]
             # Note: Secret data is base64-encoded
             print(f"Keys: {list(data.keys())}")
     """
-    result = run_kubectl(
-        "get", "secret", name,
-        "-n", namespace,
-        "-o", "json",
-        check=False
-    )
-    
-    if result.returncode != 0:
-        return None
-    
-    return json.loads(result.stdout)
+    return _get_resource("secret", name, namespace)
 
 
 def deployment_references_resource(deployment: Dict[str, Any], resource_type: str, resource_name: str) -> bool:
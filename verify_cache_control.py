@@ -4,49 +4,88 @@ Simple test to verify Cache-Control headers are properly set.
 This can be run without pytest to validate the implementation.
 """
 
+import io
+import json
 import sys
-sys.path.insert(0, '/home/ruby/Projects/courses/flask_helloworld_miniproject')
 
+# Run from the repository root (python verify_cache_control.py), which puts
+# the root on sys.path so the app package imports without any path setup.
 from app.app import app
 
+REQUIRED_DIRECTIVES = ('no-cache', 'no-store', 'must-revalidate')
+
+def wsgi_get(path):
+    """
+    GET a path straight through app.wsgi_app and return (status code, headers, body).
+    
+    Only header values and the body are checked here, so a minimal environ
+    and a start_response that records its arguments replace the test client.
+    """
+    environ = {
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path,
+        'SCRIPT_NAME': '',
+        'QUERY_STRING': '',
+        'SERVER_NAME': 'localhost',
+        'SERVER_PORT': '80',
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'wsgi.url_scheme': 'http',
+        'wsgi.input': io.BytesIO(),
+        'wsgi.errors': sys.stderr,
+    }
+    captured = []
+    
+    def start_response(status, headers, exc_info=None):
+        captured.append((status, headers))
+    
+    app_iter = app.wsgi_app(environ, start_response)
+    try:
+        body = b''.join(app_iter)
+    finally:
+        if hasattr(app_iter, 'close'):
+            app_iter.close()
+    
+    status, headers = captured[0]
+    return int(status.split(' ', 1)[0]), dict(headers), body
+
 def test_cache_control_headers():
     """Test that Cache-Control headers are properly set."""
-    with app.test_client() as client:
-        response = client.get('/health')
-        
-        print("Testing /health endpoint Cache-Control headers...")
-        print(f"Status Code: {response.status_code}")
-        print(f"Response JSON: {response.get_json()}")
-        print(f"\nHeaders:")
-        
-        # Check Cache-Control
-        cache_control = response.headers.get('Cache-Control', '')
-        print(f"  Cache-Control: {cache_control}")
-        assert 'no-cache' in cache_control, "Missing 'no-cache' directive"
-        assert 'no-store' in cache_control, "Missing 'no-store' directive"
-        assert 'must-revalidate' in cache_control, "Missing 'must-revalidate' directive"
-        print("    ✓ Contains no-cache")
-        print("    ✓ Contains no-store")
-        print("    ✓ Contains must-revalidate")
-        
-        # Check Pragma
-        pragma = response.headers.get('Pragma', '')
-        print(f"  Pragma: {pragma}")
-        assert pragma == 'no-cache', f"Expected 'no-cache', got '{pragma}'"
-        print("    ✓ Correct value")
-        
-        # Check Expires
-        expires = response.headers.get('Expires', '')
-        print(f"  Expires: {expires}")
-        assert expires == '0', f"Expected '0', got '{expires}'"
-        print("    ✓ Correct value")
-        
-        # Check response
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-        assert response.get_json() == {"status": "healthy"}, "Incorrect JSON response"
-        
-        print("\n✅ All Cache-Control tests passed!")
-        return True
+    status_code, headers, body = wsgi_get('/health')
+    data = json.loads(body)
+    
+    print("Testing /health endpoint Cache-Control headers...")
+    print(f"Status Code: {status_code}")
+    print(f"Response JSON: {data}")
+    print(f"\nHeaders:")
+    
+    # Check Cache-Control
+    cache_control = headers.get('Cache-Control', '')
+    print(f"  Cache-Control: {cache_control}")
+    # Compare whole directives, so e.g. 'no-cache' is not matched inside a longer token
+    directives = frozenset(d.strip().lower() for d in cache_control.split(','))
+    missing = [d for d in REQUIRED_DIRECTIVES if d not in directives]
+    assert not missing, f"Missing directive(s): {', '.join(missing)}"
+    for directive in REQUIRED_DIRECTIVES:
+        print(f"    ✓ Contains {directive}")
+    
+    # Check Pragma
+    pragma = headers.get('Pragma', '')
+    print(f"  Pragma: {pragma}")
+    assert pragma == 'no-cache', f"Expected 'no-cache', got '{pragma}'"
+    print("    ✓ Correct value")
+    
+    # Check Expires
+    expires = headers.get('Expires', '')
+    print(f"  Expires: {expires}")
+    assert expires == '0', f"Expected '0', got '{expires}'"
+    print("    ✓ Correct value")
+    
+    # Check response
+    assert status_code == 200, f"Expected 200, got {status_code}"
+    assert data == {"status": "healthy"}, "Incorrect JSON response"
+    
+    print("\n✅ All Cache-Control tests passed!")
+    return True
 
 if __name__ == "__main__":
     try: